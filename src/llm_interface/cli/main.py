@@ -93,8 +93,16 @@ def ask(ctx, prompt):
         if debug:
             click.echo(f"Sending query: {prompt}")
         
-        response = client.query(prompt, debug=debug)
-        click.echo(response)
+        # Print the response as it is generated, skipping leading whitespace
+        started = False
+        for chunk in client.query_stream(prompt, debug=debug):
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            click.echo(chunk, nl=False)
+        click.echo()
         
     except Exception as e:
         if debug:
@@ -244,6 +252,7 @@ def chat(ctx, session):
                 except click.exceptions.Abort:
                     break
         
+        session_obj.flush()
         click.echo(f"Session {session_obj.session_id} saved.")
         
     except Exception as e:
@@ -298,6 +307,8 @@ def research(ctx, query, session):
         else:
             response = session_obj.research_with_react(query, debug=debug)
         
+        session_obj.flush()
+        
         # Print response
         click.echo("\nResearch Results:\n")
         click.echo(response)
@@ -8,7 +8,8 @@ Author: Tim Hosking (https://github.com/Munger)
 
 from llm_interface.config.config import Config
 from llm_interface.config.prompt_manager import (
-    PromptManager, get_prompt_manager, get_prompt, get_prompt_value, format_prompt
+    PromptManager, get_prompt_manager, get_prompt, get_prompt_value,
+    get_template, get_formatter, format_prompt
 )
 from llm_interface.config.api_keys import api_key_manager
 
@@ -18,6 +19,8 @@ __all__ = [
     'get_prompt_manager',
     'get_prompt',
     'get_prompt_value',
+    'get_template',
+    'get_formatter',
     'format_prompt',
     'api_key_manager'
 ]
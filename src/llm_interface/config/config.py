@@ -16,10 +16,12 @@ DEFAULT_CONFIG = {
     "ollama_port": 11434,
     "default_model": "deepseek-coder:33b",  # Default model to use
     "timeout": 60,  # Request timeout in seconds
+    "max_parallel_queries": 4,  # Concurrent requests used by query_many
     
     # Session settings
     "session_dir": os.path.expanduser("~/.llm_interface/sessions"),
     "max_history": 20,  # Maximum number of messages to keep in history
+    "max_research_history": 20,  # Maximum number of research entries kept per session
     
     # Research settings
     "embeddings_model": "all-MiniLM-L6-v2",  # Sentence transformer model
@@ -27,6 +29,37 @@ DEFAULT_CONFIG = {
     "chunk_size": 1000,  # Size of text chunks for embeddings
     "chunk_overlap": 200,  # Overlap between chunks
     "max_search_results": 5,  # Maximum number of search results to return
+    "embeddings_index_type": "auto",  # FAISS index: auto, flat, hnsw or ivfpq
+    "embeddings_quantize": "none",  # "sq8" stores FAISS vectors as 8-bit scalars (~4x less memory)
+    "embeddings_refine": False,  # Re-rank quantized search results against exact vectors
+    "embeddings_mmap": True,  # Memory-map saved embeddings on load instead of reading them
+    "embeddings_batch_size": 64,  # Texts per batch when embedding many texts at once
+    "embeddings_cache_size": 4096,  # Embeddings of single texts (e.g. queries) kept in memory
+    "embeddings_search_threads": 0,  # FAISS search threads, set by the first store created (0 means one per CPU core)
+    "embeddings_device": None,  # Device for sentence-transformers, e.g. "cuda" or "cpu" (None picks CUDA when available)
+    "embeddings_faiss_gpu": True,  # Move FAISS indexes of 10,000+ vectors to a GPU (needs faiss-gpu)
+    "research_cache_size": 256,  # Maximum number of cached research queries
+    "research_cache_ttl": 3600,  # Seconds before cached research results expire
+    "http_pool_size": 32,  # Keep-alive connections per host for web requests
+    "http_retries": 2,  # Retries for web requests failing with 502, 503 or 504
+    "web_max_concurrency": 8,  # Searches and page fetches run concurrently by web research
+    "web_max_per_host": 2,  # Concurrent page fetches allowed per host
+    "web_min_host_interval": 0.5,  # Seconds between starting page fetches from the same host
+    "web_max_page_bytes": 2000000,  # Bytes of a page downloaded before the rest is skipped (0 means no limit)
+    "web_cache_dir": os.path.expanduser("~/.llm_interface/web_cache"),  # On-disk search and page cache (needs diskcache)
+    "web_cache_ttl": 86400,  # Seconds search results and fetched pages stay cached (0 disables caching)
+    "web_failure_cache_ttl": 3600,  # Seconds empty search results and failed fetches stay cached
+    "web_memory_cache_size": 512,  # Search results and pages also kept in memory
+    "react_max_concurrency": 8,  # Tool calls run concurrently per ReAct iteration
+    "react_max_needs_per_iter": 8,  # Research needs taken from each ReAct thinking step
+    "react_speculative_tool_selection": True,  # Select tools for needs while the first thinking step streams
+    "react_min_evidence_chars": 2000,  # Findings text that lets a ReAct iteration finish without an LLM evaluation
+    "react_cache_dir": os.path.expanduser("~/.llm_interface/react_cache"),  # On-disk tool result cache (needs diskcache)
+    "react_tool_cache_ttls": {  # Seconds each tool's results stay in the on-disk cache
+        "web_search": 86400,
+        "fetch_webpage": 604800,
+        "search_and_read": 86400,
+    },
 }
 
 # User config will be loaded from ~/.llm_interface/config.json if it exists
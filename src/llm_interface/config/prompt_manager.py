@@ -6,7 +6,8 @@ This module provides tools for managing and formatting prompts used across the s
 
 import os
 import json
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Callable, Optional, Union
+import functools
 import string
 
 
@@ -31,10 +32,14 @@ class PromptManager:
         
         self.prompt_file = prompt_file
         self.prompts = {}
+        # Cache of raw template values keyed by (category, name)
+        self._template_cache = {}
         self.load_prompts()
     
     def load_prompts(self) -> None:
         """Load prompts from the JSON file."""
+        self._template_cache.clear()
+        
         # First, load the default prompts if they exist
         default_prompts_file = os.path.join(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -67,6 +72,8 @@ class PromptManager:
         Args:
             new_prompts: Dictionary of new prompts to merge
         """
+        self._template_cache.clear()
+        
         for category, items in new_prompts.items():
             if category not in self.prompts:
                 self.prompts[category] = {}
@@ -105,6 +112,27 @@ class PromptManager:
             return prompt.get("value")
         return None
     
+    def get_template(self, category: str, name: str) -> Optional[Any]:
+        """
+        Get the raw template value of a prompt, caching the lookup.
+        
+        The cache is reset whenever prompts are loaded or merged.
+        
+        Args:
+            category: The category of the prompt (e.g., "research")
+            name: The name of the prompt (e.g., "system_message")
+            
+        Returns:
+            The template value, or None if not found
+        """
+        key = (category, name)
+        try:
+            return self._template_cache[key]
+        except KeyError:
+            template = self.get_prompt_value(category, name)
+            self._template_cache[key] = template
+            return template
+    
     def format_prompt(self, category: str, name: str, **kwargs) -> Optional[str]:
         """
         Format a prompt with the given variables.
@@ -117,7 +145,7 @@ class PromptManager:
         Returns:
             The formatted prompt, or None if the prompt was not found
         """
-        prompt_value = self.get_prompt_value(category, name)
+        prompt_value = self.get_template(category, name)
         
         if prompt_value is None:
             return None
@@ -138,6 +166,38 @@ class PromptManager:
             # For any other type, just return as is
             return prompt_value
     
+    def get_formatter(self, category: str, name: str) -> Callable[..., Optional[Any]]:
+        """
+        Get a function that formats a prompt with the given variables.
+        
+        The template is looked up once, so the returned function is cheaper
+        than repeated format_prompt calls when formatting the same prompt in
+        a loop. It behaves the same as format_prompt for that prompt.
+        
+        Args:
+            category: The category of the prompt (e.g., "research")
+            name: The name of the prompt (e.g., "system_message")
+            
+        Returns:
+            A function taking the prompt variables as keyword arguments
+        """
+        template = self.get_template(category, name)
+        
+        if not isinstance(template, str):
+            return functools.partial(self.format_prompt, category, name)
+        
+        format_template = template.format
+        
+        def formatter(**kwargs) -> str:
+            try:
+                return format_template(**kwargs)
+            except KeyError as e:
+                print(f"Warning: Missing variable in prompt '{category}.{name}': {e}")
+                # Return the original prompt as a fallback
+                return template
+        
+        return formatter
+    
     def save_prompts(self, save_path: Optional[str] = None) -> None:
         """
         Save the current prompts to a JSON file.
@@ -186,6 +246,14 @@ def get_prompt_value(category: str, name: str) -> Optional[Any]:
     """Get the value of a prompt by category and name."""
     return get_prompt_manager().get_prompt_value(category, name)
 
+def get_template(category: str, name: str) -> Optional[Any]:
+    """Get the raw template value of a prompt."""
+    return get_prompt_manager().get_template(category, name)
+
+def get_formatter(category: str, name: str) -> Callable[..., Optional[Any]]:
+    """Get a function that formats a prompt with the given variables."""
+    return get_prompt_manager().get_formatter(category, name)
+
 def format_prompt(category: str, name: str, **kwargs) -> Optional[Any]:
     """Format a prompt with the given variables."""
     return get_prompt_manager().format_prompt(category, name, **kwargs)
\ No newline at end of file
@@ -29,6 +29,23 @@ class BaseLLMClient(abc.ABC):
         """
         pass
     
+    def query_many(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Send several independent queries to the LLM.
+        
+        The default implementation sends the prompts one at a time.
+        Clients whose backend can serve requests in parallel should
+        override this.
+        
+        Args:
+            prompts: The prompts to send to the LLM
+            **kwargs: Additional keyword arguments for the LLM
+            
+        Returns:
+            The LLM's responses, in the same order as the prompts
+        """
+        return [self.query(prompt, **kwargs) for prompt in prompts]
+    
     @abc.abstractmethod
     def chat(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """
@@ -10,7 +10,8 @@ import json
 import os
 import requests
 import uuid
-from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Union
 
 from llm_interface.config import Config
 from llm_interface.llm.base import BaseLLMClient
@@ -62,6 +63,21 @@ class OllamaClient(BaseLLMClient):
         Returns:
             The LLM's response as a string
         """
+        return "".join(self.query_stream(prompt, model=model, debug=debug, **kwargs)).strip()
+    
+    def query_stream(self, prompt: str, model: Optional[str] = None, debug: bool = False, **kwargs) -> Iterator[str]:
+        """
+        Send a single query to the Ollama API and yield the response as it is generated.
+        
+        Args:
+            prompt: The prompt to send to the LLM
+            model: The model to use (defaults to default_model in config)
+            debug: Whether to print debug information
+            **kwargs: Additional parameters to pass to the Ollama API
+            
+        Yields:
+            Chunks of the LLM's response text, in order
+        """
         # Make sure model parameter takes priority over config
         if model is None:
             model = self.config["default_model"]
@@ -83,22 +99,55 @@ class OllamaClient(BaseLLMClient):
             response = requests.post(
                 url, 
                 json=payload,
-                timeout=self.config["timeout"]
+                timeout=self.config["timeout"],
+                stream=True
             )
             response.raise_for_status()
             
-            # Ollama streaming response - collect all chunks
-            full_response = ""
-            for line in response.iter_lines():
-                if line:
-                    json_response = json.loads(line)
-                    full_response += json_response.get("response", "")
-            
-            return full_response.strip()
+            # Ollama streaming response - yield each chunk as it arrives,
+            # up to the one marked done
+            try:
+                for line in response.iter_lines():
+                    if line:
+                        json_response = json.loads(line)
+                        chunk = json_response.get("response", "")
+                        if chunk:
+                            yield chunk
+                        if json_response.get("done"):
+                            break
+            finally:
+                response.close()
         
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Error querying Ollama: {e}")
     
+    def query_many(self, prompts: List[str], model: Optional[str] = None, debug: bool = False, **kwargs) -> List[str]:
+        """
+        Send several independent queries to the Ollama API.
+        
+        The Ollama generate endpoint takes a single prompt, so the prompts are
+        sent as concurrent requests and the server batches them according to
+        its own parallelism settings.
+        
+        Args:
+            prompts: The prompts to send to the LLM
+            model: The model to use (defaults to default_model in config)
+            debug: Whether to print debug information
+            **kwargs: Additional parameters to pass to the Ollama API
+            
+        Returns:
+            The LLM's responses, in the same order as the prompts
+        """
+        if len(prompts) <= 1:
+            return [self.query(prompt, model=model, debug=debug, **kwargs) for prompt in prompts]
+        
+        max_workers = min(len(prompts), self.config.get("max_parallel_queries", 4))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda prompt: self.query(prompt, model=model, debug=debug, **kwargs),
+                prompts
+            ))
+    
     def chat(self, messages: List[Dict[str, str]], model: Optional[str] = None, debug: bool = False, **kwargs) -> str:
         """
         Send a chat history to the Ollama API.
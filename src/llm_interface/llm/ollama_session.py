@@ -7,8 +7,13 @@ history and context with Ollama models.
 Author: Tim Hosking (https://github.com/Munger)
 """
 
+import atexit
 import re
+import sys
+import threading
 import time
+import weakref
+from collections import deque
 from typing import Dict, List, Any, Optional, Union
 
 from llm_interface.config import Config
@@ -19,6 +24,19 @@ import llm_interface.config.prompt_manager as prompt_manager
 from llm_interface.llm.research_capabilities import OllamaResearch
 
 
+# Sessions with unsaved changes, flushed to disk when the interpreter exits
+_dirty_sessions = weakref.WeakSet()
+
+
+def _flush_dirty_sessions() -> None:
+    """Flush all sessions that still have unsaved changes."""
+    for session in list(_dirty_sessions):
+        session.flush()
+
+
+atexit.register(_flush_dirty_sessions)
+
+
 class OllamaSession(LLMSession):
     """
     Ollama chat session.
@@ -47,8 +65,17 @@ class OllamaSession(LLMSession):
         self.history = history or []
         self.session_manager = FileSessionManager(config)
         
-        # Initialize research attributes
-        self.research_history = []
+        # Deferred save state: _state_lock guards the dirty flag and writer
+        # thread, _write_lock keeps snapshots reaching disk in order
+        self._dirty = False
+        self._save_thread = None
+        self._state_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        
+        # Initialize research attributes; only the most recent research
+        # entries are kept since older ones are never consulted
+        max_research_history = self.config.get("max_research_history", 20) or None
+        self.research_history = deque(maxlen=max_research_history)
         self.last_research_time = None
         self._last_research_query = None
         self._research_urls = []
@@ -61,16 +88,39 @@ class OllamaSession(LLMSession):
             try:
                 session_data = self.session_manager.load(session_id)
                 if "research_history" in session_data:
-                    self.research_history = session_data["research_history"]
+                    self.research_history = deque(session_data["research_history"],
+                                                  maxlen=max_research_history)
                 if "last_research_time" in session_data:
                     self.last_research_time = session_data["last_research_time"]
                 if "last_research_query" in session_data:
                     self._last_research_query = session_data["last_research_query"]
                 if "research_urls" in session_data:
                     self._research_urls = session_data["research_urls"]
+                
+                # Share one string per distinct URL/title across the loaded history
+                self._intern_sources(self._research_urls)
+                for entry in self.research_history:
+                    self._intern_sources(entry.get("sources", []))
             except Exception as e:
                 print(f"WARNING - Error loading research history: {e}")
     
+    @staticmethod
+    def _intern_sources(sources: List[Dict[str, Any]]) -> None:
+        """
+        Intern the URL and title strings of source entries in place.
+        
+        The same sources are repeated across research history entries and
+        the research URL list, so interning lets them share storage.
+        
+        Args:
+            sources: List of source dictionaries with 'url' and 'title' keys
+        """
+        for source in sources:
+            for key in ("url", "title"):
+                value = source.get(key)
+                if isinstance(value, str):
+                    source[key] = sys.intern(value)
+    
     def add_user_message(self, content: str) -> None:
         """
         Add a user message to the conversation history.
@@ -153,8 +203,8 @@ class OllamaSession(LLMSession):
                 # Add assistant response to history
                 self.history.append({"role": "assistant", "content": research_response})
                 
-                # Save session state
-                self.save()
+                # Save session state in the background
+                self.mark_dirty()
                 
                 return research_response
         
@@ -176,8 +226,8 @@ class OllamaSession(LLMSession):
             recent_messages = self.history[-max_history * 2:]
             self.history = system_messages + recent_messages
         
-        # Save session state
-        self.save()
+        # Save session state in the background
+        self.mark_dirty()
         
         return response
     
@@ -267,14 +317,64 @@ class OllamaSession(LLMSession):
     
     def save(self) -> None:
         """Save the session state."""
-        session_data = {
-            "history": self.history,
-            "research_history": self.research_history,
-            "last_research_time": self.last_research_time,
-            "last_research_query": getattr(self, '_last_research_query', None),
-            "research_urls": getattr(self, '_research_urls', [])
-        }
-        self.session_manager.save(self.session_id, session_data)
+        with self._write_lock:
+            with self._state_lock:
+                self._dirty = False
+                # Snapshot the lists so a background save never serializes
+                # a list that is being appended to
+                session_data = {
+                    "history": list(self.history),
+                    "research_history": list(self.research_history),
+                    "last_research_time": self.last_research_time,
+                    "last_research_query": getattr(self, '_last_research_query', None),
+                    "research_urls": list(getattr(self, '_research_urls', []))
+                }
+            try:
+                self.session_manager.save(self.session_id, session_data)
+            except Exception:
+                # Still unsaved, so a later save or the exit flush retries
+                with self._state_lock:
+                    self._dirty = True
+                raise
+    
+    def mark_dirty(self) -> None:
+        """
+        Mark the session as changed and save it in the background.
+        
+        Only one background writer runs at a time; changes made while it is
+        writing are picked up by its next pass. Call flush() to make sure
+        everything has reached disk.
+        """
+        with self._state_lock:
+            self._dirty = True
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(target=self._background_save, daemon=True)
+                self._save_thread.start()
+        _dirty_sessions.add(self)
+    
+    def _background_save(self) -> None:
+        """Save the session until no unsaved changes remain."""
+        while True:
+            with self._state_lock:
+                if not self._dirty:
+                    self._save_thread = None
+                    return
+            try:
+                self.save()
+            except Exception as e:
+                print(f"WARNING - Error saving session {self.session_id}: {e}")
+                with self._state_lock:
+                    self._save_thread = None
+                return
+    
+    def flush(self) -> None:
+        """Save the session now if it has unsaved changes."""
+        # Wait for any in-flight background write before checking the flag
+        with self._write_lock:
+            pass
+        if self._dirty:
+            self.save()
+        _dirty_sessions.discard(self)
     
     def research(self, query: str, debug: bool = False, **kwargs) -> str:
         """
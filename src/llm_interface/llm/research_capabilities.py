@@ -8,14 +8,103 @@ Author: Tim Hosking (https://github.com/Munger)
 """
 
 import re
+import sys
 import time
-from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 from llm_interface.config import Config
+from llm_interface.utils.helpers import TTLCache
 # Direct import of the prompt_manager module
 import llm_interface.config.prompt_manager as prompt_manager
 
 
+# Patterns used to pull suggested search terms out of LLM responses
+_LIST_PREFIX_RE = re.compile(r'^(?:[-*•]|\d+\.|\d+\))')
+# Only the leading marker is stripped; numbers later in the item (3.11, step 2)) stay
+_LIST_STRIP_RE = re.compile(r'^(?:[-*•]|\d+\.|\d+\))\s*')
+# Characters a list item can start with, checked before running the regex
+_LIST_MARKER_CHARS = frozenset('-*•0123456789')
+# Quotes inside words are apostrophes (I'd, Let's), not phrase delimiters
+_QUOTED_RE = re.compile(r'(?<!\w)["\']([^"\']+)["\'](?!\w)')
+_KEYWORD_RE = re.compile(
+    r'(?:try|query|search|research|use|topic|explore|investigate)\s+["\'"]?([^.,;:"\'\n]{5,})["\'"]?',
+    re.IGNORECASE
+)
+
+
+# web_research prompts used by the finding formatters, looked up once per
+# research call rather than once per finding
+_FINDING_PROMPTS = ("format_search_result", "format_web_search_results", "format_webpage_content")
+
+
+def _format_web_search_finding(index: int, result: Dict[str, Any], add_source,
+                               formatters: Dict[str, Any]) -> Tuple[str, bool]:
+    """
+    Format a web_search finding for the research system message.
+    
+    Args:
+        index: The finding number
+        result: The tool result
+        add_source: Callback taking (url, title) to record a source
+        formatters: web_research prompt formatters keyed by prompt name
+        
+    Returns:
+        Tuple of (formatted content, whether the search returned results)
+    """
+    results = result.get("results", [])
+    format_search_result = formatters["format_search_result"]
+    
+    search_results_parts = []
+    for j, res in enumerate(results[:5], 1):
+        get = res.get
+        url, title, snippet = get("url", ""), get("title", ""), get("snippet", "")
+        
+        search_results_parts.append(format_search_result(i=index, j=j, title=title, snippet=snippet, url=url))
+        add_source(url, title)
+    
+    content = formatters["format_web_search_results"](count=len(results),
+                                                      results_content="".join(search_results_parts))
+    return content, len(results) > 0
+
+
+def _format_webpage_finding(index: int, result: Dict[str, Any], add_source,
+                            formatters: Dict[str, Any]) -> Tuple[str, bool]:
+    """
+    Format a fetch_webpage or search_and_read finding for the research system message.
+    
+    Args:
+        index: The finding number
+        result: The tool result
+        add_source: Callback taking (url, title) to record a source
+        formatters: web_research prompt formatters keyed by prompt name
+        
+    Returns:
+        Tuple of (formatted content, whether any page content was retrieved)
+    """
+    get = result.get
+    url, title, content = get("url", ""), get("title", ""), get("content", "")
+    
+    add_source(url, title or url)
+    
+    if not content:
+        return "", False
+    
+    # Include a brief excerpt of the content
+    content_summary = content[:500] + "..." if len(content) > 500 else content
+    formatted = formatters["format_webpage_content"](i=index, title=title, url=url,
+                                                     content_summary=content_summary)
+    return formatted, True
+
+
+# Finding formatters by tool name; other tools contribute no tool-specific content
+_FINDING_FORMATTERS = {
+    "web_search": _format_web_search_finding,
+    "fetch_webpage": _format_webpage_finding,
+    "search_and_read": _format_webpage_finding,
+}
+
+
 class OllamaResearch:
     """
     Research capabilities for Ollama sessions.
@@ -34,6 +123,16 @@ class OllamaResearch:
         """
         self.client = client
         self.config = config or Config()
+        
+        # Cache of merged web research results, keyed by normalized query
+        self._research_cache = TTLCache(
+            maxsize=self.config.get("research_cache_size", 256),
+            ttl=self.config.get("research_cache_ttl", 3600)
+        )
+        
+        # Web researcher is created on first use and reused so its HTTP
+        # connections are kept alive across research calls
+        self._web_researcher = None
     
     def perform_research(self, query: str, session, debug: bool = False, **kwargs) -> str:
         """
@@ -54,61 +153,21 @@ class OllamaResearch:
             if debug:
                 print(f"DEBUG - Performing web research for query: {query}")
             
-            # Step 1: Ask the LLM to generate search strategies focused on finding specific items
-            # Use the prompt manager to get the search strategy prompt
-            search_strategy_prompt = prompt_manager.format_prompt("research", "search_strategy_prompt", query=query)
-            
-            if debug:
-                print(f"DEBUG - Asking LLM for search strategies")
-            
-            strategy_response = self.client.query(search_strategy_prompt, debug=debug)
-            suggested_queries = self._extract_search_terms(strategy_response, query)
-            
-            if debug and suggested_queries:
-                print(f"DEBUG - LLM suggested {len(suggested_queries)} search queries: {suggested_queries}")
+            # Reuse the web researcher (and its connection pool) between calls
+            if self._web_researcher is None:
+                self._web_researcher = WebResearcher(self.config)
+            researcher = self._web_researcher
             
-            # Initialize web researcher
-            researcher = WebResearcher(self.config)
+            # Reuse recent results for the same query instead of searching again
+            cache_key = query.strip().lower()
+            all_results = self._research_cache.get(cache_key)
             
-            # Step 2: Perform the primary research with original query
-            primary_results = researcher.research(query, debug=debug)
-            
-            # Step 3: Perform additional research with LLM-suggested queries if available
-            all_results = {
-                "query": query,
-                "search_results": primary_results.get("search_results", []).copy(),
-                "content": primary_results.get("content", []).copy(),
-                "timestamp": primary_results.get("timestamp", 0)
-            }
-            
-            # Track URLs we've already seen
-            seen_urls = {item.get("url", "") for item in all_results["content"]}
-            
-            # Use LLM-suggested queries for additional research if we need more content
-            if suggested_queries and len(all_results["content"]) < 10:
-                # Limit to top 3 suggested queries to keep latency reasonable
-                for suggested_query in suggested_queries[:3]:
-                    if debug:
-                        print(f"DEBUG - Researching with LLM-suggested query: {suggested_query}")
-                    
-                    additional_results = researcher.research(suggested_query, debug=debug)
-                    
-                    # Add new content that we haven't seen before
-                    for item in additional_results.get("content", []):
-                        url = item.get("url", "")
-                        if url and url not in seen_urls:
-                            seen_urls.add(url)
-                            all_results["content"].append(item)
-                    
-                    # Add new search results that we haven't seen before
-                    for result in additional_results.get("search_results", []):
-                        url = result.get("url", "")
-                        if url and not any(r.get("url", "") == url for r in all_results["search_results"]):
-                            all_results["search_results"].append(result)
-                    
-                    # If we've found enough content, stop researching
-                    if len(all_results["content"]) >= 15:
-                        break
+            if all_results is not None:
+                if debug:
+                    print(f"DEBUG - Using cached research results for query: {query}")
+            else:
+                all_results = self._gather_research(query, researcher, debug=debug)
+                self._research_cache.set(cache_key, all_results)
             
             # Format research for prompt
             research_context = researcher.format_research_for_prompt(all_results)
@@ -120,13 +179,8 @@ class OllamaResearch:
             valid_findings = len(all_results["content"]) > 0 and \
                              any(len(item.get("content", "")) > 0 for item in all_results["content"])
             
-            # Store URLs for future reference
-            all_urls = []
-            for item in all_results["content"]:
-                url = item.get("url", "")
-                title = item.get("title", "")
-                if url and not any(source.get("url") == url for source in all_urls):
-                    all_urls.append({"url": url, "title": title or url})
+            # Deduplicated sources collected while merging the results
+            all_urls = all_results["sources"]
             
             # Store in the _research_urls attribute
             if all_urls:
@@ -154,16 +208,18 @@ class OllamaResearch:
             # Store the research query
             session._last_research_query = query
             
-            # Create sources section for the system message
-            sources_list = ""
+            # Build the sources list for the system message and the response in one pass
+            format_source_entry = prompt_manager.get_formatter("web_research", "format_source_entry")
+            source_entries = []
+            response_source_entries = []
             for i, source in enumerate(all_urls, 1):
                 source_title = source.get('title', 'Unknown title')
                 source_url = source.get('url', '')
-                sources_list += prompt_manager.format_prompt("web_research", "format_source_entry",
-                                            index=i, title=source_title, url=source_url)
+                source_entries.append(format_source_entry(index=i, title=source_title, url=source_url))
+                response_source_entries.append(f"{i}. {source_title}: {source_url}\n")
             
             sources_section = prompt_manager.format_prompt("web_research", "format_sources_section",
-                                          sources_list=sources_list)
+                                          sources_list="".join(source_entries))
             
             # Add system message based on whether valid findings were found
             if valid_findings:
@@ -192,19 +248,12 @@ class OllamaResearch:
             
             # Format the final response
             if valid_findings:
-                # Create sources list for the response
-                sources_list = ""
-                for i, source in enumerate(all_urls, 1):
-                    source_title = source.get('title', 'Unknown title')
-                    source_url = source.get('url', '')
-                    sources_list += f"{i}. {source_title}: {source_url}\n"
-                
                 # Use the prompt manager to format the response
                 immediate_response = prompt_manager.format_prompt("response_formats", "research_response",
                                                  query=query,
                                                  response_content=response,
                                                  num_sources=len(all_urls),
-                                                 sources_list=sources_list)
+                                                 sources_list="".join(response_source_entries))
             else:
                 # Use the prompt manager to format the response for no results
                 immediate_response = prompt_manager.format_prompt("response_formats", "no_results_response",
@@ -214,8 +263,8 @@ class OllamaResearch:
             # Save the assistant's response to history
             session.history.append({"role": "assistant", "content": immediate_response})
             
-            # Save session state
-            session.save()
+            # Save session state in the background
+            session.mark_dirty()
             
             return immediate_response
             
@@ -226,6 +275,113 @@ class OllamaResearch:
             # Fallback if research module isn't available
             return session.chat(f"Please answer this question with your knowledge: {query}", debug=debug, **kwargs)
     
+    def _gather_research(self, query: str, researcher, debug: bool = False) -> Dict[str, Any]:
+        """
+        Run web research for a query and merge in LLM-suggested follow-ups.
+        
+        Args:
+            query: The research question
+            researcher: The WebResearcher instance to use
+            debug: Whether to print debug information
+            
+        Returns:
+            Merged research results with query, search_results, content,
+            sources and timestamp keys
+        """
+        # Step 1: Ask the LLM to generate search strategies focused on finding specific items
+        # Use the prompt manager to get the search strategy prompt
+        search_strategy_prompt = prompt_manager.format_prompt("research", "search_strategy_prompt", query=query)
+        
+        if debug:
+            print(f"DEBUG - Asking LLM for search strategies")
+        
+        # Step 2: Perform the primary research with original query while the
+        # LLM is generating strategies, since neither depends on the other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            strategy_future = executor.submit(self.client.query, search_strategy_prompt, debug=debug)
+            primary_future = executor.submit(researcher.research, query, debug=debug)
+            
+            strategy_response = strategy_future.result()
+            primary_results = primary_future.result()
+        
+        suggested_queries = self._extract_search_terms(strategy_response, query)
+        
+        if debug and suggested_queries:
+            print(f"DEBUG - LLM suggested {len(suggested_queries)} search queries: {suggested_queries}")
+        
+        # Step 3: Perform additional research with LLM-suggested queries if available
+        all_results = {
+            "query": query,
+            "search_results": primary_results.get("search_results", []).copy(),
+            "content": primary_results.get("content", []).copy(),
+            "timestamp": primary_results.get("timestamp", 0)
+        }
+        
+        # One seen-URL set per bucket, filled once from the primary results and
+        # shared by every later merge. The content set also dedups the sources.
+        content_seen = set()
+        search_seen = {result.get("url", "") for result in all_results["search_results"]}
+        all_urls = []
+        
+        def add_source(item: Dict[str, Any]) -> None:
+            """Record a content item as a research source."""
+            url = item["url"]
+            all_urls.append({"url": sys.intern(url), "title": sys.intern(item.get("title", "") or url)})
+        
+        for item in all_results["content"]:
+            url = item.get("url", "")
+            if url and url not in content_seen:
+                content_seen.add(url)
+                add_source(item)
+        
+        # Use LLM-suggested queries for additional research if we need more content
+        if suggested_queries and len(all_results["content"]) < 10:
+            # Limit to top 3 suggested queries to keep latency reasonable
+            for suggested_query in suggested_queries[:3]:
+                # Stop before starting another search once we have enough content
+                if len(all_results["content"]) >= 15:
+                    break
+                
+                if debug:
+                    print(f"DEBUG - Researching with LLM-suggested query: {suggested_query}")
+                
+                additional_results = researcher.research(suggested_query, debug=debug)
+                
+                # Add new content and search results that we haven't seen before
+                for item in self._merge_new_by_url(all_results["content"], content_seen,
+                                                   additional_results.get("content", [])):
+                    add_source(item)
+                self._merge_new_by_url(all_results["search_results"], search_seen,
+                                       additional_results.get("search_results", []))
+        
+        all_results["sources"] = all_urls
+        
+        return all_results
+    
+    @staticmethod
+    def _merge_new_by_url(bucket: List[Dict[str, Any]],
+                          seen: set,
+                          items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Append items whose URL has not been seen yet to a result list.
+        
+        Args:
+            bucket: The list to append new items to
+            seen: URLs already in the bucket (updated in place)
+            items: Candidate items with a 'url' key
+            
+        Returns:
+            The items that were added
+        """
+        added = []
+        for item in items:
+            url = item.get("url", "")
+            if url and url not in seen:
+                seen.add(url)
+                bucket.append(item)
+                added.append(item)
+        return added
+    
     def perform_react_research(self, query: str, session, debug: bool = False, **kwargs) -> str:
         """
         Perform in-depth research using the ReAct pattern.
@@ -259,65 +415,40 @@ class OllamaResearch:
             
             # Extract all URLs from the research
             all_urls = []
+            url_seen = set()
             valid_findings = False
             
+            def add_source(url: str, title: str) -> None:
+                """Record a source URL the first time it is seen."""
+                if url and url not in url_seen:
+                    url_seen.add(url)
+                    all_urls.append({"url": sys.intern(url), "title": sys.intern(title)})
+            
+            format_findings = prompt_manager.get_formatter("web_research", "format_findings")
+            finding_formatters = {
+                name: prompt_manager.get_formatter("web_research", name)
+                for name in _FINDING_PROMPTS
+            }
+            
             # Format findings for the LLM's reference
-            findings_text = ""
+            findings_parts = []
             for i, finding in enumerate(research_context.get("findings", []), 1):
-                need = finding.get("need", "")
-                tool = finding.get("tool", "")
-                result = finding.get("result", {})
-                
-                # Check if we have any valid search results
-                if (tool == "web_search" and result.get("results") and len(result.get("results", [])) > 0) or \
-                   (tool == "search_and_read" and result.get("content")) or \
-                   (tool == "fetch_webpage" and result.get("content")):
-                    valid_findings = True
+                get = finding.get
+                need, tool, result = get("need", ""), get("tool", ""), get("result", {})
                 
-                # Format finding based on tool type
+                # Format finding based on tool type, noting whether it found anything
                 tool_specific_content = ""
-                if tool == "web_search":
-                    results = result.get("results", [])
-                    search_results_content = ""
-                    for j, res in enumerate(results[:5], 1):
-                        url = res.get("url", "")
-                        title = res.get("title", "")
-                        snippet = res.get("snippet", "")
-                        
-                        # Format the search result using the template
-                        result_format = prompt_manager.format_prompt("web_research", "format_search_result", 
-                                                     i=i, j=j, title=title, snippet=snippet, url=url)
-                        search_results_content += result_format
-                        
-                        # Add URL to list
-                        if url and not any(source.get("url") == url for source in all_urls):
-                            all_urls.append({"url": url, "title": title})
-                    
-                    # Format the web search results
-                    tool_specific_content = prompt_manager.format_prompt("web_research", "format_web_search_results",
-                                                        count=len(results),
-                                                        results_content=search_results_content)
-                
-                elif tool == "fetch_webpage" or tool == "search_and_read":
-                    url = result.get("url", "")
-                    title = result.get("title", "")
-                    content = result.get("content", "")
-                    
-                    # Add URL to list
-                    if url and not any(source.get("url") == url for source in all_urls):
-                        all_urls.append({"url": url, "title": title or url})
-                    
-                    if content:
-                        # Include a brief excerpt of the content
-                        content_summary = content[:500] + "..." if len(content) > 500 else content
-                        tool_specific_content = prompt_manager.format_prompt("web_research", "format_webpage_content",
-                                                           i=i, title=title, url=url, content_summary=content_summary)
+                format_tool_finding = _FINDING_FORMATTERS.get(tool)
+                if format_tool_finding is not None:
+                    tool_specific_content, has_results = format_tool_finding(i, result, add_source, finding_formatters)
+                    valid_findings = valid_findings or has_results
                 
                 # Format the finding using the template
-                finding_format = prompt_manager.format_prompt("web_research", "format_findings",
-                                             index=i, need=need, tool=tool, 
-                                             tool_specific_content=tool_specific_content)
-                findings_text += finding_format
+                finding_format = format_findings(index=i, need=need, tool=tool,
+                                                 tool_specific_content=tool_specific_content)
+                findings_parts.append(finding_format)
+            
+            findings_text = "".join(findings_parts)
             
             # Record research request in research history
             research_entry = {
@@ -333,16 +464,18 @@ class OllamaResearch:
             # Store the last research query
             session._last_research_query = query
             
-            # Create dedicated section for source reference
-            sources_list = ""
+            # Create dedicated section for source reference, building the
+            # response sources list in the same pass
+            format_source_entry = prompt_manager.get_formatter("web_research", "format_source_entry")
+            source_entries = []
+            response_source_entries = []
             for i, source in enumerate(all_urls, 1):
                 source_title = source.get('title', 'Unknown title')
                 source_url = source.get('url', '')
                 
                 # Format source entry using the template
-                source_entry = prompt_manager.format_prompt("web_research", "format_source_entry",
-                                          index=i, title=source_title, url=source_url)
-                sources_list += source_entry
+                source_entries.append(format_source_entry(index=i, title=source_title, url=source_url))
+                response_source_entries.append(f"{i}. {source_title}: {source_url}\n")
                 
                 # Also save URL separately to make sure we can reference it later
                 if not hasattr(session, '_research_urls'):
@@ -352,7 +485,7 @@ class OllamaResearch:
             
             # Format the sources section using the template
             sources_section = prompt_manager.format_prompt("web_research", "format_sources_section",
-                                          sources_list=sources_list)
+                                          sources_list="".join(source_entries))
             
             # Create message based on whether valid findings were found
             if valid_findings:
@@ -372,13 +505,6 @@ class OllamaResearch:
             # Synthesise findings
             synthesised_response = researcher.synthesize(research_context, debug=debug)
             
-            # Create sources list for the response
-            sources_list = ""
-            for i, source in enumerate(all_urls, 1):
-                source_title = source.get('title', 'Unknown title')
-                source_url = source.get('url', '')
-                sources_list += f"{i}. {source_title}: {source_url}\n"
-            
             # Create an immediate response based on whether we had valid findings
             if valid_findings:
                 # Use the prompt manager to format the response
@@ -386,7 +512,7 @@ class OllamaResearch:
                                                  query=query,
                                                  response_content=synthesised_response,
                                                  num_sources=len(all_urls),
-                                                 sources_list=sources_list)
+                                                 sources_list="".join(response_source_entries))
             else:
                 # Use the prompt manager to format the response for no results
                 immediate_response = prompt_manager.format_prompt("response_formats", "no_results_response",
@@ -396,8 +522,8 @@ class OllamaResearch:
             # Save the assistant's response to history
             session.history.append({"role": "assistant", "content": immediate_response})
             
-            # Save session state
-            session.save()
+            # Save session state in the background
+            session.mark_dirty()
             
             return immediate_response
             
@@ -425,10 +551,13 @@ class OllamaResearch:
         lines = llm_response.split('\n')
         for line in lines:
             line = line.strip()
+            # Cheaply skip lines that cannot start with a list marker
+            if not line or line[0] not in _LIST_MARKER_CHARS:
+                continue
             # Match lines starting with hyphens, bullets, numbers, etc.
-            if re.match(r'^[-*•]|\d+\.|\d+\)', line):
+            if _LIST_PREFIX_RE.match(line):
                 # Extract the actual term (removing the prefix)
-                term = re.sub(r'^[-*•]|\d+\.|\d+\)\s*', '', line).strip()
+                term = _LIST_STRIP_RE.sub('', line).strip()
                 # Skip very short terms, quotes, and duplicates of original query
                 if len(term) > 5 and term.lower() != original_query.lower():
                     suggested_terms.append(term)
@@ -436,13 +565,14 @@ class OllamaResearch:
         # If no list items found, try to extract phrases using more generic patterns
         if not suggested_terms:
             # Look for quoted phrases
-            quoted_phrases = re.findall(r'["\']([^"\']+)["\']', llm_response)
+            quoted_phrases = _QUOTED_RE.findall(llm_response)
             for phrase in quoted_phrases:
                 if len(phrase) > 5 and phrase.lower() != original_query.lower():
                     suggested_terms.append(phrase)
             
-            # Look for phrases after certain keywords
-            keyword_phrases = re.findall(r'(?:try|query|search|research|use|topic|explore|investigate)\s+["\'"]?([^.,;:"\'\n]{5,})["\'"]?', llm_response, re.IGNORECASE)
+            # Look for phrases after certain keywords; these scan
+            # separately, since quoted and keyword matches may overlap
+            keyword_phrases = _KEYWORD_RE.findall(llm_response)
             for phrase in keyword_phrases:
                 phrase = phrase.strip()
                 if len(phrase) > 5 and phrase.lower() != original_query.lower():
@@ -6,14 +6,208 @@ think about what they know, what they need to find out, and
 take actions to gather that information.
 """
 
+import os
 import re
 import json
+import asyncio
+import functools
+import hashlib
 import time
-from typing import Dict, List, Any, Optional, Tuple, Union
+import reprlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, Union
 
 from llm_interface.config import Config
 from llm_interface.tools.base import registry as tool_registry
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+
+# Patterns for parsing LLM responses, compiled once at import time
+_LIST_MARKER_RE = re.compile(r'^[ \t]*(?:(\d+\.)|[-*])(?=\s)', re.MULTILINE)
+_TOOL_RE = re.compile(r'Tool:\s*(\w+)')
+_PARAMS_RE = re.compile(r'Parameters:\s*{(.*?)}', re.DOTALL)
+_KV_RE = re.compile(r'"(\w+)":\s*"([^"]*)"')
+_LOOSE_KV_RE = re.compile(r'(\w+):\s*"?([^",\n]+)"?')
+_QUERY_RE = re.compile(r'(?:query|search for|research):\s*"?([^"]+)"?', re.IGNORECASE)
+_URL_RE = re.compile(r'(?:url|webpage|site|link):\s*"?(https?://[^\s"]+)"?', re.IGNORECASE)
+_QUESTION_PREFIX_RE = re.compile(
+    r'^(?:what|how|why|when|where|who|which)\s+(?:is|are|does|do|can|should|would|will|has|have)\s+',
+    re.IGNORECASE
+)
+_KEY_PHRASE_RE = re.compile(r'"([^"]+)"')
+_KEYWORD_RE = re.compile(r'\b\w{4,}\b')
+_NON_WORD_RE = re.compile(r'\W+')
+_STOP_WORDS = frozenset({
+    'this', 'that', 'these', 'those', 'what', 'which', 'when', 'where', 'who', 'whose', 'whom', 'how', 'why'
+})
+_COMPLETE_RE = re.compile(r'Research complete:\s*(Yes|No)', re.IGNORECASE)
+_MISSING_SECTION_RE = re.compile(r'Missing information:(.*?)(?:$|(?:\n\n))', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',\s*}')
+_ITEM_RE = re.compile(r'(?:^|\n)\s*(?:\d+\.|-|\*)\s+(.*?)(?=(?:\n\s*(?:\d+\.|-|\*))|$)', re.DOTALL)
+
+
+# Bounded repr for summarising arbitrary tool results without building the
+# full string form of large payloads first
+_SHORT_REPR = reprlib.Repr()
+_SHORT_REPR.maxstring = 100
+_SHORT_REPR.maxother = 100
+_SHORT_REPR.maxdict = 3
+_SHORT_REPR.maxlist = 3
+
+
+def _short_repr(obj: Any, limit: int = 100) -> str:
+    """
+    Summarise an object in at most roughly limit characters.
+    
+    Args:
+        obj: The object to summarise
+        limit: Maximum length before truncation
+        
+    Returns:
+        A short string form of the object
+    """
+    text = obj if isinstance(obj, str) else _SHORT_REPR.repr(obj)
+    if len(text) > limit:
+        text = text[:limit] + "..."
+    return text
+
+
+def _iter_marked_items(text: str, markers: Iterable[re.Match]) -> Iterator[Tuple[str, Optional[re.Match]]]:
+    """
+    Split list items out of text at line-leading list markers.
+    
+    Each item runs from the end of its marker to the start of the next
+    one, so no per-character lookahead is needed. Items are produced
+    lazily, so callers can stop scanning early.
+    
+    Args:
+        text: The text containing the list
+        markers: Matches of the list markers in text, in order
+        
+    Returns:
+        Iterator of (stripped item, marker ending it) pairs; the last item
+        runs to the end of text and is paired with None
+    """
+    previous = None
+    for marker in markers:
+        if previous is not None:
+            yield text[previous.end():marker.start()].strip(), marker
+        previous = marker
+    
+    if previous is not None:
+        yield text[previous.end():].strip(), None
+
+
+def _numbered_markers(text: str, pos: int = 0) -> Iterator[re.Match]:
+    """
+    Find numbered list markers (1. Item) in text.
+    
+    Args:
+        text: The text to scan
+        pos: Offset to start scanning at; must be the start of a line
+        
+    Returns:
+        Iterator of marker matches in order
+    """
+    return (marker for marker in _LIST_MARKER_RE.finditer(text, pos) if marker.group(1))
+
+
+def _split_marked_items(text: str, markers: Iterable[re.Match], limit: int) -> List[str]:
+    """
+    Split list items out of text at line-leading list markers.
+    
+    Scanning stops once limit items have been collected.
+    
+    Args:
+        text: The text containing the list
+        markers: Matches of the list markers in text, in order
+        limit: Maximum number of items to return
+        
+    Returns:
+        The non-empty, stripped items in order
+    """
+    items = []
+    for item, _ in _iter_marked_items(text, markers):
+        if item:
+            items.append(item)
+            if len(items) >= limit:
+                break
+    return items
+
+
+# Sentinel for disk cache lookups, since None is a valid tool result
+_CACHE_MISS = object()
+
+
+def _canonical_need(need: str) -> str:
+    """
+    Normalise a research need so trivially different phrasings compare equal.
+    
+    Case, punctuation and runs of whitespace are ignored, so
+    "What is X?" and "what is x" map to the same key.
+    
+    Args:
+        need: The research need
+        
+    Returns:
+        The canonical form of the need
+    """
+    return _NON_WORD_RE.sub(' ', need.lower()).strip()
+
+
+def _json_loads(text: str) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+    
+    Args:
+        text: The JSON text
+        
+    Returns:
+        The parsed value
+        
+    Raises:
+        ValueError: If the text is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+    """
+    Serialise a value to JSON, using orjson when it is installed.
+    
+    Values that are not JSON types are converted with str().
+    
+    Args:
+        obj: The value to serialise
+        sort_keys: Whether to sort dictionary keys
+        
+    Returns:
+        The JSON text
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the stdlib handles
+            pass
+    return json.dumps(obj, sort_keys=sort_keys, default=str)
+
 
 class ReActResearcher:
     """
@@ -34,6 +228,19 @@ class ReActResearcher:
         self.llm_client = llm_client
         self.config = config or Config()
         self.max_iterations = self.config.get("react_max_iterations", 5)
+        self.max_concurrency = max(1, self.config.get("react_max_concurrency", 8))
+        self.max_needs = max(1, self.config.get("react_max_needs_per_iter", 8))
+        self.speculative_selection = self.config.get("react_speculative_tool_selection", True)
+        self.min_evidence_chars = self.config.get("react_min_evidence_chars", 2000)
+        self.tool_cache_ttls = self.config.get("react_tool_cache_ttls", {}) or {}
+        
+        # On-disk tool result cache shared across research() calls, opened on first use
+        self._disk_cache = None
+        self._disk_cache_opened = False
+        
+        # Formatted tool list, rebuilt only when the registry changes
+        self._tools_version = None
+        self._tools_description = ""
     
     def research(self, query: str, debug: bool = False) -> Dict[str, Any]:
         """
@@ -51,8 +258,15 @@ class ReActResearcher:
         
         # Initial thinking step
         thinking_prompt = self._create_thinking_prompt(query)
-        thinking_result = self.llm_client.query(thinking_prompt, debug=debug)
+        speculative_selections = {}
+        if self.speculative_selection and hasattr(self.llm_client, "query_stream"):
+            thinking_result, speculative_selections = self._think_with_speculative_selection(
+                thinking_prompt, debug
+            )
+        else:
+            thinking_result = self.llm_client.query(thinking_prompt, debug=debug)
         research_needs = self._extract_research_needs(thinking_result)
+        initial_needs = list(research_needs)
         
         if debug:
             print(f"DEBUG - Initial research needs: {research_needs}")
@@ -65,6 +279,14 @@ class ReActResearcher:
             "findings": []
         }
         
+        # Successful tool results for this request, so repeated calls with
+        # the same parameters (across iterations or fallbacks) are free
+        tool_cache = {}
+        
+        # Canonical forms of needs that already have a finding, so repeats
+        # with different case or punctuation are skipped before tool selection
+        researched_needs = set()
+        
         # ReAct loop
         for iteration in range(self.max_iterations):
             if debug:
@@ -73,17 +295,24 @@ class ReActResearcher:
             # For each research need, determine and use appropriate tool
             iteration_context = {"needs": [], "actions": [], "observations": []}
             
+            pending_needs = []
+            pending_keys = set()
             for need in research_needs:
                 # Skip if we've already researched this need
-                if any(finding["need"] == need for finding in context["findings"]):
+                key = _canonical_need(need)
+                if key in researched_needs or key in pending_keys:
                     if debug:
                         print(f"DEBUG - Skipping already researched need: {need}")
                     continue
-                
-                # Determine which tool to use
-                tool_selection_prompt = self._create_tool_selection_prompt(need, tool_registry.list_tools())
-                tool_selection_result = self.llm_client.query(tool_selection_prompt, debug=debug)
-                tool_name, params = self._extract_tool_selection(tool_selection_result)
+                pending_needs.append(need)
+                pending_keys.add(key)
+            
+            # Determine which tool to use for every need
+            tool_selections = self._select_tools(pending_needs, debug, speculative_selections)
+            speculative_selections = {}
+            
+            tool_calls = []
+            for need, (tool_name, params) in zip(pending_needs, tool_selections):
                 
                 # Fix for empty query parameters - use the research need as the query if empty
                 if tool_name in ['web_search', 'search_and_read', 'find_list'] and (
@@ -109,9 +338,31 @@ class ReActResearcher:
                 if debug:
                     print(f"DEBUG - Selected tool: {tool_name}, params: {params}")
                 
-                # Execute the tool
-                try:
-                    result = tool_registry.execute_tool(tool_name, **params)
+                tool_calls.append((need, tool_name, params))
+            
+            # Execute the tools concurrently; each call is network-bound
+            outcomes = self._execute_tools(
+                [(tool_name, params) for _, tool_name, params in tool_calls],
+                tool_cache
+            )
+            
+            # Fall back to web_search for any non-search tool that failed
+            fallback_queries = {
+                index: self._create_search_query_from_need(tool_calls[index][0])
+                for index, (_, error) in enumerate(outcomes)
+                if error is not None and tool_calls[index][1] != 'web_search'
+            }
+            fallback_outcomes = dict(zip(
+                fallback_queries,
+                self._execute_tools([
+                    ('web_search', {"query": search_query})
+                    for search_query in fallback_queries.values()
+                ], tool_cache)
+            ))
+            
+            # Record the outcomes in need order
+            for index, ((need, tool_name, params), (result, error)) in enumerate(zip(tool_calls, outcomes)):
+                if error is None:
                     context["tools_used"].append(tool_name)
                     
                     # Add to iteration context
@@ -125,53 +376,59 @@ class ReActResearcher:
                         "tool": tool_name,
                         "result": result
                     })
+                    researched_needs.add(_canonical_need(need))
                     
                     if debug:
                         print(f"DEBUG - Tool execution successful")
+                    continue
                 
-                except Exception as e:
+                if debug:
+                    print(f"DEBUG - Tool execution failed: {error}")
+                
+                # Record the failure but continue with research
+                iteration_context["observations"].append(
+                    {"error": f"Tool execution failed: {str(error)}"}
+                )
+                
+                if index not in fallback_outcomes:
+                    continue
+                
+                search_query = fallback_queries[index]
+                result, fallback_err = fallback_outcomes[index]
+                if fallback_err is not None:
                     if debug:
-                        print(f"DEBUG - Tool execution failed: {e}")
-                    
-                    # Record the failure but continue with research
-                    iteration_context["observations"].append(
-                        {"error": f"Tool execution failed: {str(e)}"}
-                    )
-                    
-                    # Try to fallback to web_search if another tool failed
-                    if tool_name != 'web_search':
-                        try:
-                            if debug:
-                                print(f"DEBUG - Attempting fallback to web_search")
-                            search_query = self._create_search_query_from_need(need)
-                            result = tool_registry.execute_tool('web_search', query=search_query)
-                            
-                            # Add to context
-                            context["tools_used"].append('web_search')
-                            iteration_context["actions"].append({"tool": 'web_search', "params": {"query": search_query}})
-                            iteration_context["observations"].append(result)
-                            
-                            # Add finding
-                            context["findings"].append({
-                                "need": need,
-                                "tool": 'web_search',
-                                "result": result
-                            })
-                            
-                            if debug:
-                                print(f"DEBUG - Fallback to web_search successful")
-                                
-                        except Exception as fallback_err:
-                            if debug:
-                                print(f"DEBUG - Fallback to web_search failed: {fallback_err}")
+                        print(f"DEBUG - Fallback to web_search failed: {fallback_err}")
+                    continue
+                
+                # Add to context
+                context["tools_used"].append('web_search')
+                iteration_context["actions"].append({"tool": 'web_search', "params": {"query": search_query}})
+                iteration_context["observations"].append(result)
+                
+                # Add finding
+                context["findings"].append({
+                    "need": need,
+                    "tool": 'web_search',
+                    "result": result
+                })
+                researched_needs.add(_canonical_need(need))
+                
+                if debug:
+                    print(f"DEBUG - Fallback to web_search successful")
             
             # Add iteration to context
             context["iterations"].append(iteration_context)
             
-            # Check if we have enough information
-            evaluation_prompt = self._create_evaluation_prompt(query, context)
-            evaluation_result = self.llm_client.query(evaluation_prompt, debug=debug)
-            is_complete, missing_info = self._extract_completion_status(evaluation_result)
+            # Check if we have enough information, asking the LLM only when
+            # the findings do not obviously cover the initial needs
+            if self._heuristic_complete(context, initial_needs):
+                is_complete, missing_info = True, []
+                if debug:
+                    print(f"DEBUG - All initial needs covered with enough evidence, skipping evaluation")
+            else:
+                evaluation_prompt = self._create_evaluation_prompt(query, context)
+                evaluation_result = self.llm_client.query(evaluation_prompt, debug=debug)
+                is_complete, missing_info = self._extract_completion_status(evaluation_result)
             
             if debug:
                 if is_complete:
@@ -202,6 +459,146 @@ class ReActResearcher:
         
         return context
     
+    def _execute_tools(self, 
+                       calls: List[Tuple[str, Dict[str, Any]]], 
+                       tool_cache: Optional[Dict[Tuple[str, str], Any]] = None) -> List[Tuple[Any, Optional[Exception]]]:
+        """
+        Execute several tool calls concurrently.
+        
+        Calls with the same tool and parameters run once, and calls already
+        in the cache are not run at all.
+        
+        Args:
+            calls: (tool_name, params) pairs to execute
+            tool_cache: Optional cache of successful results keyed by
+                (tool_name, serialized params), updated in place
+            
+        Returns:
+            (result, error) pairs in the same order as calls; error is None
+            when the tool succeeded
+        """
+        if tool_cache is None:
+            tool_cache = {}
+        
+        keys = [
+            (tool_name, _json_dumps(params, sort_keys=True))
+            for tool_name, params in calls
+        ]
+        
+        # Only run calls that are neither cached nor already scheduled
+        pending = {}
+        for key, call in zip(keys, calls):
+            if key not in tool_cache and key not in pending:
+                pending[key] = call
+        
+        # Results of deterministic tools may survive from earlier research
+        disk_cache = self._get_disk_cache() if pending else None
+        if disk_cache is not None:
+            for key in list(pending):
+                if key[0] in self.tool_cache_ttls:
+                    result = disk_cache.get(self._disk_cache_key(key), default=_CACHE_MISS)
+                    if result is not _CACHE_MISS:
+                        tool_cache[key] = result
+                        del pending[key]
+        
+        if len(pending) <= 1:
+            outcomes = [self._execute_tool(call) for call in pending.values()]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(pending), self.max_concurrency)) as executor:
+                outcomes = list(executor.map(self._execute_tool, pending.values()))
+        
+        fresh = dict(zip(pending, outcomes))
+        for key, (result, error) in fresh.items():
+            if error is None:
+                tool_cache[key] = result
+                # Empty or failed results are only kept for this request, so a
+                # transient network failure is not replayed in later research
+                ttl = self.tool_cache_ttls.get(key[0])
+                if disk_cache is not None and ttl and not self._is_empty_result(result):
+                    disk_cache.set(self._disk_cache_key(key), result, expire=ttl)
+        
+        return [
+            (tool_cache[key], None) if key in tool_cache else fresh[key]
+            for key in keys
+        ]
+    
+    def _get_disk_cache(self):
+        """
+        Open the on-disk tool result cache on first use.
+        
+        Returns:
+            The cache, or None if diskcache is not installed, no tool has a
+            cache TTL, or the cache directory cannot be opened
+        """
+        if not self._disk_cache_opened:
+            self._disk_cache_opened = True
+            if DISKCACHE_AVAILABLE and self.tool_cache_ttls:
+                cache_dir = os.path.expanduser(
+                    self.config.get("react_cache_dir", "~/.llm_interface/react_cache")
+                )
+                try:
+                    self._disk_cache = diskcache.Cache(cache_dir)
+                except Exception as e:
+                    print(f"Warning: Could not open tool cache at {cache_dir}: {e}")
+        return self._disk_cache
+    
+    @staticmethod
+    def _is_empty_result(result: Any) -> bool:
+        """
+        Check whether a tool result reports an error or found nothing.
+        
+        Args:
+            result: The tool result
+            
+        Returns:
+            True if the result has an "error" key or empty content or results
+        """
+        if not isinstance(result, dict):
+            return False
+        if "error" in result:
+            return True
+        return any(key in result and not result[key] for key in ("content", "results"))
+    
+    @staticmethod
+    def _disk_cache_key(key: Tuple[str, str]) -> str:
+        """Hash a (tool_name, serialized params) cache key for the disk cache."""
+        tool_name, params_json = key
+        return hashlib.sha256(f"{tool_name}|{params_json}".encode("utf-8")).hexdigest()
+    
+    def _execute_tool(self, call: Tuple[str, Dict[str, Any]]) -> Tuple[Any, Optional[Exception]]:
+        """
+        Execute a single tool call, capturing any error.
+        
+        Args:
+            call: (tool_name, params) pair
+            
+        Returns:
+            (result, None) on success or (None, error) on failure
+        """
+        tool_name, params = call
+        try:
+            return tool_registry.execute_tool(tool_name, **params), None
+        except Exception as e:
+            return None, e
+    
+    async def aresearch(self, query: str, debug: bool = False) -> Dict[str, Any]:
+        """
+        Conduct research using the ReAct pattern without blocking the event loop.
+        
+        The LLM client and tools are synchronous, so the research loop runs
+        in the loop's default executor; several queries can be awaited
+        concurrently with asyncio.gather.
+        
+        Args:
+            query: The research query
+            debug: Whether to print debug information
+            
+        Returns:
+            Research results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.research, query, debug))
+    
     def synthesize(self, research_context: Dict[str, Any], debug: bool = False) -> str:
         """
         Synthesize research findings into a coherent response.
@@ -216,13 +613,19 @@ class ReActResearcher:
         synthesis_prompt = self._create_synthesis_prompt(research_context)
         return self.llm_client.query(synthesis_prompt, debug=debug)
     
+    def _get_tool_descriptions(self) -> str:
+        """Get the formatted list of available tools, cached per registry version."""
+        if self._tools_version != tool_registry.version:
+            self._tools_description = "\n".join(
+                f"- {tool['name']}: {tool['description']}"
+                for tool in tool_registry.list_tools()
+            )
+            self._tools_version = tool_registry.version
+        return self._tools_description
+    
     def _create_thinking_prompt(self, query: str) -> str:
         """Create prompt for initial thinking."""
-        available_tools = tool_registry.list_tools()
-        tool_descriptions = "\n".join([
-            f"- {tool['name']}: {tool['description']}"
-            for tool in available_tools
-        ])
+        tool_descriptions = self._get_tool_descriptions()
         
         return (
             f"I need to research: {query}\n\n"
@@ -234,19 +637,18 @@ class ReActResearcher:
     
     def _extract_research_needs(self, thinking_result: str) -> List[str]:
         """Extract research needs from thinking result."""
-        # Look for numbered or bulleted items
-        needs = []
+        # Look for numbered or bulleted items in a single scan
+        numbered = []
+        bulleted = []
+        for marker in _LIST_MARKER_RE.finditer(thinking_result):
+            (numbered if marker.group(1) else bulleted).append(marker)
         
-        # Match numbered items (1. Item)
-        numbered_pattern = r'\d+\.\s+(.*?)(?=(?:\d+\.)|$)'
-        numbered_matches = re.findall(numbered_pattern, thinking_result, re.DOTALL)
-        needs.extend([match.strip() for match in numbered_matches if match.strip()])
+        # Match numbered items (1. Item); bullets inside them stay part of the item
+        needs = _split_marked_items(thinking_result, numbered, self.max_needs)
         
         # Match bulleted items (- Item or * Item)
         if not needs:
-            bulleted_pattern = r'[-*]\s+(.*?)(?=(?:[-*])|$)'
-            bulleted_matches = re.findall(bulleted_pattern, thinking_result, re.DOTALL)
-            needs.extend([match.strip() for match in bulleted_matches if match.strip()])
+            needs = _split_marked_items(thinking_result, bulleted, self.max_needs)
         
         # If no structured items found, try to split by sentences or newlines
         if not needs:
@@ -259,14 +661,173 @@ class ReActResearcher:
                 sentences = thinking_result.split('.')
                 needs = [s.strip() + '.' for s in sentences if len(s.strip()) > 10]
         
-        return needs
+        return needs[:self.max_needs]
     
-    def _create_tool_selection_prompt(self, need: str, available_tools: List[Dict[str, str]]) -> str:
+    def _think_with_speculative_selection(self, 
+                                          thinking_prompt: str, 
+                                          debug: bool = False) -> Tuple[str, Dict[str, Future]]:
+        """
+        Stream the thinking step and start tool selection for each need early.
+        
+        As soon as a numbered need is complete (the next numbered marker has
+        arrived), its tool selection prompt is sent on a worker thread, so
+        several selections are already in flight when thinking finishes.
+        Items are split exactly as _extract_research_needs splits the full
+        result, so each selection is keyed by the need it will be used for;
+        the last item is never sent early, since any text after it belongs
+        to it.
+        
+        Args:
+            thinking_prompt: The thinking prompt
+            debug: Whether to print debug information
+            
+        Returns:
+            The full thinking result and pending tool selection results keyed
+            by need text
+        """
+        selections = {}
+        buffer = ""
+        # Where the scan for unfinished items resumes; everything before it
+        # has already been dispatched
+        scan_from = 0
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for chunk in self.llm_client.query_stream(thinking_prompt, debug=debug):
+                buffer += chunk
+                # Items can only be closed by a new line
+                if len(selections) >= self.max_needs or "\n" not in chunk:
+                    continue
+                
+                for need, next_marker in _iter_marked_items(buffer, _numbered_markers(buffer, scan_from)):
+                    # Only an item followed by another marker is complete
+                    if next_marker is None:
+                        break
+                    
+                    scan_from = next_marker.start()
+                    if need and need not in selections:
+                        if debug:
+                            print(f"DEBUG - Speculatively selecting tool for: {need}")
+                        selections[need] = executor.submit(
+                            self.llm_client.query,
+                            self._create_tool_selection_prompt(need),
+                            debug=debug
+                        )
+                        if len(selections) >= self.max_needs:
+                            break
+        
+        return buffer, selections
+    
+    def _select_tools(self, 
+                      needs: List[str], 
+                      debug: bool = False,
+                      speculative_selections: Optional[Dict[str, Future]] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Choose a tool and parameters for each research need.
+        
+        Needs with a speculative selection already made during thinking use
+        that answer. Several remaining needs are sent to the LLM as one
+        batched prompt so the tool descriptions are only processed once. Any
+        need the batched answer does not cover falls back to its own tool
+        selection prompt.
+        
+        Args:
+            needs: The research needs
+            debug: Whether to print debug information
+            speculative_selections: Pending tool selection results keyed by need
+            
+        Returns:
+            (tool_name, params) pairs in the same order as needs
+        """
+        selections = [None] * len(needs)
+        
+        for i, need in enumerate(needs):
+            future = (speculative_selections or {}).get(need)
+            if future is not None and future.exception() is None:
+                selections[i] = self._extract_tool_selection(future.result())
+        
+        remaining = [i for i, selection in enumerate(selections) if selection is None]
+        if len(remaining) > 1:
+            batched_prompt = self._create_batched_tool_selection_prompt([needs[i] for i in remaining])
+            batched_result = self.llm_client.query(batched_prompt, debug=debug)
+            batched = self._extract_batched_tool_selection(batched_result, [needs[i] for i in remaining])
+            for i, selection in zip(remaining, batched):
+                selections[i] = selection
+        
+        missing = [i for i, selection in enumerate(selections) if selection is None]
+        if missing:
+            if debug and len(remaining) > 1:
+                print(f"DEBUG - Batched tool selection missed {len(missing)} needs, querying individually")
+            
+            results = self.llm_client.query_many([
+                self._create_tool_selection_prompt(needs[i])
+                for i in missing
+            ], debug=debug)
+            for i, result in zip(missing, results):
+                selections[i] = self._extract_tool_selection(result)
+        
+        return selections
+    
+    def _create_batched_tool_selection_prompt(self, needs: List[str]) -> str:
+        """Create one tool selection prompt covering several needs."""
+        tool_descriptions = self._get_tool_descriptions()
+        need_list = "\n".join(f"{i}. {need}" for i, need in enumerate(needs, 1))
+        
+        return (
+            f"I need to find information about each of these research needs:\n{need_list}\n\n"
+            f"Available tools:\n{tool_descriptions}\n\n"
+            f"For each research need, which tool should I use, and with what parameters?\n\n"
+            f"Select exactly one tool per need and specify the parameters to use.\n"
+            f"Respond with only a JSON array containing one object per need, in the same order:\n"
+            f"[\n"
+            f"  {{\"need\": \"...\", \"tool\": \"tool_name\", \"parameters\": {{\"param1\": \"value1\"}}}}\n"
+            f"]\n\n"
+            f"IMPORTANT: For search tools like web_search or search_and_read, you MUST provide a specific, "
+            f"non-empty search query that includes relevant keywords from the research need."
+        )
+    
+    def _extract_batched_tool_selection(self, 
+                                        batched_result: str, 
+                                        needs: List[str]) -> List[Optional[Tuple[str, Dict[str, Any]]]]:
+        """Extract per-need tool selections from a batched LLM response."""
+        selections = [None] * len(needs)
+        
+        # Parse the outermost JSON array in the response
+        start = batched_result.find('[')
+        end = batched_result.rfind(']')
+        if start == -1 or end <= start:
+            return selections
+        try:
+            items = _json_loads(batched_result[start:end + 1])
+        except ValueError:
+            return selections
+        if not isinstance(items, list):
+            return selections
+        items = [item for item in items if isinstance(item, dict) and item.get("tool")]
+        
+        # Match items to needs by the need text the model echoed back, or
+        # by position if it reworded them but answered every need
+        positions = {need: i for i, need in enumerate(needs)}
+        matched = [
+            (positions[item["need"]], item)
+            for item in items if isinstance(item.get("need"), str) and item["need"] in positions
+        ]
+        if len(matched) < len(items) and len(items) == len(needs):
+            matched = enumerate(items)
+        
+        for i, item in matched:
+            # The parameters are already parsed, so use them as they are
+            tool_name = str(item["tool"])
+            parameters = item.get("parameters")
+            params = dict(parameters) if isinstance(parameters, dict) else {}
+            if tool_name == "web_search" and "query" not in params:
+                params["query"] = ""
+            selections[i] = (tool_name, params)
+        
+        return selections
+    
+    def _create_tool_selection_prompt(self, need: str) -> str:
         """Create prompt for tool selection."""
-        tool_descriptions = "\n".join([
-            f"- {tool['name']}: {tool['description']}"
-            for tool in available_tools
-        ])
+        tool_descriptions = self._get_tool_descriptions()
         
         return (
             f"I need to find information about: {need}\n\n"
@@ -286,8 +847,7 @@ class ReActResearcher:
     def _extract_tool_selection(self, tool_selection_result: str) -> Tuple[str, Dict[str, Any]]:
         """Extract tool selection from LLM response."""
         # Extract tool name
-        tool_pattern = r'Tool:\s*(\w+)'
-        tool_match = re.search(tool_pattern, tool_selection_result)
+        tool_match = _TOOL_RE.search(tool_selection_result)
         
         if not tool_match:
             # Default to web search if no tool specified
@@ -297,24 +857,24 @@ class ReActResearcher:
         
         # Extract parameters
         params = {}
-        params_pattern = r'Parameters:\s*{(.*?)}'
-        params_match = re.search(params_pattern, tool_selection_result, re.DOTALL)
+        params_match = _PARAMS_RE.search(tool_selection_result)
         
         if params_match:
             # Try to parse JSON
             try:
-                params_str = "{" + params_match.group(1) + "}"
-                params = json.loads(params_str)
+                # LLMs often leave a trailing comma before the closing brace
+                params_str = _TRAILING_COMMA_RE.sub('}', "{" + params_match.group(1) + "}")
+                params = _json_loads(params_str)
             except:
                 # If JSON parsing fails, try to extract key-value pairs
-                param_pairs = re.findall(r'"(\w+)":\s*"([^"]*)"', params_match.group(1))
+                param_pairs = _KV_RE.findall(params_match.group(1))
                 for key, value in param_pairs:
                     params[key] = value
         
         # Handle cases where parameters are listed in a different format
         if not params:
             # Look for key-value pairs in the format "param: value"
-            param_pairs = re.findall(r'(\w+):\s*"?([^",\n]+)"?', tool_selection_result)
+            param_pairs = _LOOSE_KV_RE.findall(tool_selection_result)
             for key, value in param_pairs:
                 if key.lower() != "tool" and key.lower() != "parameters":
                     params[key] = value
@@ -322,8 +882,7 @@ class ReActResearcher:
         # Ensure required parameters for the selected tool
         if tool_name == "web_search" and "query" not in params:
             # Extract potential query from the context
-            query_pattern = r'(?:query|search for|research):\s*"?([^"]+)"?'
-            query_match = re.search(query_pattern, tool_selection_result, re.IGNORECASE)
+            query_match = _QUERY_RE.search(tool_selection_result)
             
             if query_match:
                 params["query"] = query_match.group(1)
@@ -333,8 +892,7 @@ class ReActResearcher:
         
         elif tool_name == "fetch_webpage" and "url" not in params:
             # Extract URL from the context
-            url_pattern = r'(?:url|webpage|site|link):\s*"?(https?://[^\s"]+)"?'
-            url_match = re.search(url_pattern, tool_selection_result, re.IGNORECASE)
+            url_match = _URL_RE.search(tool_selection_result)
             
             if url_match:
                 params["url"] = url_match.group(1)
@@ -344,8 +902,7 @@ class ReActResearcher:
                 
         elif tool_name == "search_and_read" and "query" not in params:
             # Extract potential query from the context
-            query_pattern = r'(?:query|search for|research):\s*"?([^"]+)"?'
-            query_match = re.search(query_pattern, tool_selection_result, re.IGNORECASE)
+            query_match = _QUERY_RE.search(tool_selection_result)
             
             if query_match:
                 params["query"] = query_match.group(1)
@@ -370,25 +927,23 @@ class ReActResearcher:
         query = need
         
         # Remove prefixes like "What is" or "How to"
-        query = re.sub(r'^(?:what|how|why|when|where|who|which)\s+(?:is|are|does|do|can|should|would|will|has|have)\s+', '', query, flags=re.IGNORECASE)
+        query = _QUESTION_PREFIX_RE.sub('', query)
         
         # Remove question marks
         query = query.replace('?', '')
         
         # Extract key phrases using regex
-        key_phrase_pattern = r'"([^"]+)"'
-        key_phrases = re.findall(key_phrase_pattern, query)
+        key_phrases = _KEY_PHRASE_RE.findall(query)
         
         if key_phrases:
             # Use quoted phrases in the query if found
             return ' '.join(key_phrases)
         
         # Extract key terms (longer words more likely to be important)
-        words = re.findall(r'\b\w{4,}\b', query)
+        words = _KEYWORD_RE.findall(query)
         
         # Remove common stop words
-        stop_words = {'this', 'that', 'these', 'those', 'what', 'which', 'when', 'where', 'who', 'whose', 'whom', 'how', 'why'}
-        keywords = [word for word in words if word.lower() not in stop_words]
+        keywords = [word for word in words if word.lower() not in _STOP_WORDS]
         
         # If we don't have enough keywords, use the original query
         if len(keywords) < 3:
@@ -397,10 +952,54 @@ class ReActResearcher:
         # Otherwise join keywords
         return ' '.join(keywords)
     
+    def _heuristic_complete(self, context: Dict[str, Any], initial_needs: List[str]) -> bool:
+        """
+        Decide cheaply whether research is clearly complete.
+        
+        Research counts as complete when every initial need has a finding
+        with non-empty content or results (needs differing only in case or
+        punctuation share their findings), and the findings hold at least
+        react_min_evidence_chars characters of text between them.
+        
+        Args:
+            context: The research context
+            initial_needs: The needs from the initial thinking step
+            
+        Returns:
+            True if the LLM evaluation can be skipped
+        """
+        if not initial_needs:
+            return False
+        
+        covered = set()
+        evidence_chars = 0
+        for finding in context["findings"]:
+            result = finding["result"]
+            if not isinstance(result, dict) or "error" in result:
+                continue
+            
+            chars = 0
+            content = result.get("content")
+            if isinstance(content, str):
+                chars += len(content)
+            results = result.get("results")
+            if isinstance(results, list):
+                for item in results:
+                    if isinstance(item, dict):
+                        chars += len(str(item.get("snippet", "")))
+            
+            if chars:
+                covered.add(_canonical_need(finding["need"]))
+                evidence_chars += chars
+        
+        return evidence_chars >= self.min_evidence_chars and all(
+            _canonical_need(need) in covered for need in initial_needs
+        )
+    
     def _create_evaluation_prompt(self, query: str, context: Dict[str, Any]) -> str:
         """Create prompt for evaluating research progress."""
         # Format findings in a readable way
-        findings_text = ""
+        parts = []
         for i, finding in enumerate(context.get("findings", []), 1):
             need = finding.get("need", "")
             tool = finding.get("tool", "")
@@ -410,13 +1009,14 @@ class ReActResearcher:
             result_text = ""
             if tool == "web_search":
                 results = result.get("results", [])
-                result_text = f"Found {len(results)} search results"
+                result_lines = [f"Found {len(results)} search results"]
                 if results:
-                    result_text += ":\n"
+                    result_lines.append(":\n")
                     for j, res in enumerate(results[:3], 1):
-                        result_text += f"  {j}. {res.get('title', '')}\n"
+                        result_lines.append(f"  {j}. {res.get('title', '')}\n")
                     if len(results) > 3:
-                        result_text += f"  ...and {len(results) - 3} more results\n"
+                        result_lines.append(f"  ...and {len(results) - 3} more results\n")
+                result_text = "".join(result_lines)
             
             elif tool == "fetch_webpage":
                 content = result.get("content", "")
@@ -428,14 +1028,15 @@ class ReActResearcher:
             
             else:
                 # Generic result formatting
-                result_text = str(result)
-                if len(result_text) > 100:
-                    result_text = result_text[:100] + "..."
+                result_text = _short_repr(result)
             
-            findings_text += f"Finding {i}:\n"
-            findings_text += f"- Need: {need}\n"
-            findings_text += f"- Tool: {tool}\n"
-            findings_text += f"- Result: {result_text}\n\n"
+            parts.append(
+                f"Finding {i}:\n"
+                f"- Need: {need}\n"
+                f"- Tool: {tool}\n"
+                f"- Result: {result_text}\n\n"
+            )
+        findings_text = "".join(parts)
         
         return (
             f"I'm researching: {query}\n\n"
@@ -452,8 +1053,7 @@ class ReActResearcher:
     def _extract_completion_status(self, evaluation_result: str) -> Tuple[bool, List[str]]:
         """Extract research completion status and missing information."""
         # Check if research is complete
-        complete_pattern = r'Research complete:\s*(Yes|No)'
-        complete_match = re.search(complete_pattern, evaluation_result, re.IGNORECASE)
+        complete_match = _COMPLETE_RE.search(evaluation_result)
         
         is_complete = False
         if complete_match:
@@ -467,15 +1067,13 @@ class ReActResearcher:
         
         if not is_complete:
             # Look for a "Missing information" section
-            missing_section_pattern = r'Missing information:(.*?)(?:$|(?:\n\n))'
-            missing_section_match = re.search(missing_section_pattern, evaluation_result, re.DOTALL)
+            missing_section_match = _MISSING_SECTION_RE.search(evaluation_result)
             
             if missing_section_match:
                 missing_section = missing_section_match.group(1).strip()
                 
                 # Look for numbered or bulleted items
-                item_pattern = r'(?:^|\n)\s*(?:\d+\.|-|\*)\s+(.*?)(?=(?:\n\s*(?:\d+\.|-|\*))|$)'
-                items = re.findall(item_pattern, missing_section, re.DOTALL)
+                items = _ITEM_RE.findall(missing_section)
                 
                 if items:
                     missing_info = [item.strip() for item in items if item.strip()]
@@ -489,10 +1087,10 @@ class ReActResearcher:
     def _create_iteration_thinking_prompt(self, query: str, context: Dict[str, Any]) -> str:
         """Create prompt for thinking about next research steps."""
         # Summarize findings so far
-        findings_summary = ""
-        for i, finding in enumerate(context.get("findings", []), 1):
-            need = finding.get("need", "")
-            findings_summary += f"{i}. {need}\n"
+        findings_summary = "".join(
+            f"{i}. {finding.get('need', '')}\n"
+            for i, finding in enumerate(context.get("findings", []), 1)
+        )
         
         return (
             f"I'm researching: {query}\n\n"
@@ -506,9 +1104,6 @@ class ReActResearcher:
         """Create prompt for synthesizing research findings."""
         query = research_context.get("query", "")
         
-        # Format findings in a readable way
-        findings_text = ""
-        
         # Check if we actually found any useful information
         useful_findings = [f for f in research_context.get("findings", []) 
                            if f.get("tool") in ["web_search", "fetch_webpage", "search_and_read", "find_list"] and 
@@ -517,44 +1112,48 @@ class ReActResearcher:
         has_useful_info = len(useful_findings) > 0
         
         if has_useful_info:
+            # Format findings in a readable way
+            parts = []
             for i, finding in enumerate(research_context.get("findings", []), 1):
                 need = finding.get("need", "")
                 tool = finding.get("tool", "")
                 result = finding.get("result", {})
                 
-                findings_text += f"Source {i}: {need}\n"
+                parts.append(f"Source {i}: {need}\n")
                 
                 # Format result based on tool type
                 if tool == "web_search":
                     results = result.get("results", [])
                     for j, res in enumerate(results[:5], 1):
-                        findings_text += f"- {res.get('title', '')}: {res.get('snippet', '')}\n"
-                        findings_text += f"  URL: {res.get('url', '')}\n"
+                        parts.append(f"- {res.get('title', '')}: {res.get('snippet', '')}\n")
+                        parts.append(f"  URL: {res.get('url', '')}\n")
                 
                 elif tool == "fetch_webpage":
                     url = result.get("url", "")
                     content = result.get("content", "")
-                    findings_text += f"- Webpage: {url}\n"
+                    parts.append(f"- Webpage: {url}\n")
                     
                     # Add a brief excerpt of the content
                     if content:
                         content_excerpt = content[:500] + "..." if len(content) > 500 else content
-                        findings_text += f"- Content excerpt: {content_excerpt}\n"
+                        parts.append(f"- Content excerpt: {content_excerpt}\n")
                 
                 elif tool == "search_and_read" or tool == "find_list":
                     url = result.get("url", "")
                     title = result.get("title", "")
                     content = result.get("content", "")
                     
-                    findings_text += f"- Source: {title}\n"
-                    findings_text += f"- URL: {url}\n"
+                    parts.append(f"- Source: {title}\n")
+                    parts.append(f"- URL: {url}\n")
                     
                     # Add a brief excerpt of the content
                     if content:
                         content_excerpt = content[:500] + "..." if len(content) > 500 else content
-                        findings_text += f"- Content excerpt: {content_excerpt}\n"
+                        parts.append(f"- Content excerpt: {content_excerpt}\n")
                 
-                findings_text += "\n"
+                parts.append("\n")
+            
+            findings_text = "".join(parts)
         else:
             findings_text = "No relevant information was found during the research process. Please provide a response based on your general knowledge while acknowledging the limitations of the research."
         
@@ -7,6 +7,11 @@ vector embeddings for document retrieval.
 
 import os
 import json
+import math
+import hashlib
+import threading
+from collections import Counter
+from functools import lru_cache
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple, Union
 
@@ -16,8 +21,181 @@ try:
 except ImportError:
     FAISS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
 from llm_interface.config import Config
 from llm_interface.research.document import Document
+from llm_interface.utils.helpers import TTLCache
+
+
+_faiss_threads_lock = threading.Lock()
+_faiss_threads_set = False
+
+
+def _set_faiss_threads(threads: int) -> None:
+    """
+    Set the number of OpenMP threads FAISS uses, once per process.
+    
+    The setting is process-wide, so only the first store created applies
+    its configuration; later stores, and searches already running in
+    other threads, are not affected by a store being constructed.
+    
+    Args:
+        threads: Number of threads, or 0 for one per CPU core
+    """
+    global _faiss_threads_set
+    with _faiss_threads_lock:
+        if _faiss_threads_set:
+            return
+        _faiss_threads_set = True
+    faiss.omp_set_num_threads(threads or os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=None)
+def _squared_l2_kernel(dim: int):
+    """
+    Build a squared L2 distance kernel for one embedding dimensionality.
+    
+    The kernel makes one fused pass over the matrix, split across cores,
+    with no temporary difference matrix. With dim compiled in as a constant
+    the inner loop has a fixed trip count that can be fully unrolled and
+    vectorized. Requires numba.
+    
+    Args:
+        dim: Embedding dimensionality
+        
+    Returns:
+        Compiled function taking a float32 matrix with one embedding per row,
+        a float32 query vector, and a float32 array receiving one squared
+        distance per row
+    """
+    def squared_l2_distances(matrix, query, out):
+        for i in prange(matrix.shape[0]):
+            total = 0.0
+            for j in range(dim):
+                diff = matrix[i, j] - query[j]
+                total += diff * diff
+            out[i] = total
+    
+    # Compiled now for C-contiguous float32 arrays; the disk cache is keyed
+    # by dim and honours NUMBA_CACHE_DIR like the chunking kernels
+    return njit("void(f4[:, ::1], f4[::1], f4[::1])", parallel=True, fastmath=True, cache=True)(squared_l2_distances)
+
+
+def _write_json(path: str, data: Any) -> None:
+    """
+    Write a value to a JSON file, using orjson when it is installed.
+    
+    Args:
+        path: File path
+        data: JSON-serialisable value
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson cannot encode get the standard library's handling
+            pass
+        else:
+            with open(path, 'wb') as f:
+                f.write(encoded)
+            return
+    
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
+def _read_json(path: str) -> Any:
+    """
+    Read a JSON file, using orjson when it is installed.
+    
+    Args:
+        path: File path
+        
+    Returns:
+        Parsed value
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Files written by json.dump may hold NaN, which orjson rejects
+            pass
+    return json.loads(content)
+
+
+def _normalize_rows(rows: np.ndarray) -> np.ndarray:
+    """
+    Scale each row of a matrix to unit L2 length.
+    
+    Args:
+        rows: float32 matrix
+        
+    Returns:
+        New float32 matrix; all-zero rows stay zero, as with faiss.normalize_L2
+    """
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (rows / norms).astype(np.float32, copy=False)
+
+
+def _append_rows(buffer: Optional[np.ndarray], row_count: int, rows: np.ndarray) -> np.ndarray:
+    """
+    Append rows to a matrix buffer, growing it by doubling when full.
+    
+    Doubling keeps the copying done over many appends linear in the total
+    number of rows, instead of copying the whole matrix on every append.
+    
+    Args:
+        buffer: Matrix whose first row_count rows are in use, or None
+        row_count: Number of rows in use
+        rows: float32 rows to append
+        
+    Returns:
+        Buffer with the appended rows after the first row_count rows; the
+        same buffer if they fit
+    """
+    needed = row_count + len(rows)
+    capacity = 0 if buffer is None else len(buffer)
+    if needed > capacity:
+        grown = np.empty((max(2 * capacity, needed), rows.shape[1]), dtype=np.float32)
+        if row_count:
+            grown[:row_count] = buffer[:row_count]
+        buffer = grown
+    buffer[row_count:needed] = rows
+    return buffer
+
+
+@lru_cache(maxsize=65536)
+def _word_bucket(word: str, dim: int) -> int:
+    """
+    Map a word to an embedding dimension for the fallback embedder.
+    
+    MD5 keeps the mapping stable across processes, so fallback embeddings
+    saved in a collection stay comparable with new ones; caching the
+    bucket means each distinct word is only hashed once.
+    
+    Args:
+        word: The word
+        dim: Dimensionality of the embedding
+        
+    Returns:
+        Index of the dimension the word counts towards
+    """
+    return int.from_bytes(hashlib.md5(word.encode()).digest(), 'big') % dim
 
 
 class SimpleVectorStore:
@@ -39,17 +217,61 @@ class SimpleVectorStore:
         self.embeddings_dir = self.config["embeddings_dir"]
         os.makedirs(self.embeddings_dir, exist_ok=True)
         
-        # Initialize empty store
-        self.embeddings = {}
+        # Initialize empty store; row i of the embedding matrix belongs to
+        # the document with id _doc_ids[i]. The matrices are views of the
+        # first len(_doc_ids) rows of buffers that grow by doubling.
         self.documents = {}
+        self._emb_buffer = None
+        self._emb_matrix = None
+        self._doc_ids = []
+        self._id_to_row = {}
+        self._unit_buffer = None
+        self._unit_matrix = None
         self.faiss_index = None
+        self.faiss_doc_ids = []
+        
+        # What the current FAISS index was built as, to tell when adding rows
+        # to it is no longer enough
+        self._faiss_index_key = None
+        self._faiss_trained_size = 0
+        
+        # Rows in the FAISS index last written to each index path since the
+        # index was built; appended rows are added again from the embeddings
+        # on load, so the file is only rewritten once the collection doubles
+        self._faiss_saved_rows = {}
         
         # Default to L2 distance
         self.metric = "l2"
+        
+        # "auto" picks an exact or approximate index from the collection size
+        self.index_type = self.config.get("embeddings_index_type", "auto")
+        
+        # "sq8" stores vectors as 8-bit scalars: ~4x less memory for a small recall loss
+        self.quantize = self.config.get("embeddings_quantize", "none")
+        self.refine = self.config.get("embeddings_refine", False)
+        
+        # Map saved embeddings into memory on load instead of reading them
+        self.mmap = self.config.get("embeddings_mmap", True)
+        
+        # Large indexes go to a GPU when FAISS was built with GPU support
+        self.use_gpu = self.config.get("embeddings_faiss_gpu", True)
+        self._gpu_resources = None
+        self._faiss_on_gpu = False
+        
+        # FAISS spreads batched searches over this many OpenMP threads
+        if FAISS_AVAILABLE:
+            _set_faiss_threads(self.config.get("embeddings_search_threads", 0))
+        
+        # Searches read one published (faiss_index, faiss_doc_ids, doc_ids,
+        # emb_matrix, unit_matrix, documents, metric) tuple without locking;
+        # writers hold the lock, only append to published data past the
+        # published rows, and publish a new tuple when done
+        self._write_lock = threading.Lock()
+        self._snapshot = None
     
     def add_embeddings(self, 
                        documents: List[Document], 
-                       embeddings: List[List[float]],
+                       embeddings: Union[List[List[float]], np.ndarray],
                        collection_name: str = "default",
                        debug: bool = False) -> None:
         """
@@ -57,7 +279,7 @@ class SimpleVectorStore:
         
         Args:
             documents: List of Document objects
-            embeddings: List of embedding vectors (one per document)
+            embeddings: Embedding vectors (one per document)
             collection_name: Name of the collection
             debug: Whether to print debug information
         """
@@ -68,21 +290,132 @@ class SimpleVectorStore:
         collection_dir = os.path.join(self.embeddings_dir, collection_name)
         os.makedirs(collection_dir, exist_ok=True)
         
-        # Add documents and embeddings to memory store
-        for doc, emb in zip(documents, embeddings):
+        with self._write_lock:
+            # Add documents and embeddings to memory store
+            first_new_row, replaced = len(self._doc_ids), False
+            if documents:
+                first_new_row, replaced = self._add_rows(documents, np.ascontiguousarray(embeddings, dtype=np.float32))
+            
+            # Update FAISS index if available
+            if FAISS_AVAILABLE:
+                self._update_faiss_index(first_new_row, replaced)
+            
+            self._publish_snapshot()
+            
+            # Save collection to disk
+            self._save_collection(collection_name)
+            
+        if debug:
+            print(f"DEBUG - Added {len(documents)} documents to vector store collection '{collection_name}'")
+    
+    def _add_rows(self, documents: List[Document], embeddings: np.ndarray) -> Tuple[int, bool]:
+        """
+        Store documents and their embedding rows.
+        
+        A document whose id is already stored replaces the old document and
+        embedding in place; new ids are appended to the matrix in one copy.
+        
+        Args:
+            documents: List of Document objects
+            embeddings: float32 matrix with one row per document
+            
+        Returns:
+            The index of the first appended row, and whether any stored row
+            was replaced
+        """
+        first_new_row = len(self._doc_ids)
+        replaced = False
+        
+        # Positions in this batch to append, keyed by id so a repeated id keeps
+        # its first position in the order but takes the last embedding
+        append_positions = {}
+        for pos, doc in enumerate(documents):
             doc_id = doc.doc_id or str(len(self.documents))
+            row = self._id_to_row.get(doc_id)
+            if row is not None and not replaced:
+                self._copy_buffers()
+                self.documents = dict(self.documents)
             self.documents[doc_id] = doc
-            self.embeddings[doc_id] = emb
+            if row is not None:
+                self._emb_matrix[row] = embeddings[pos]
+                if self._unit_matrix is not None:
+                    self._unit_matrix[row] = _normalize_rows(embeddings[pos:pos + 1])[0]
+                replaced = True
+            else:
+                append_positions[doc_id] = pos
         
-        # Save collection to disk
-        self._save_collection(collection_name)
+        if not append_positions:
+            return first_new_row, replaced
         
-        # Rebuild FAISS index if available
-        if FAISS_AVAILABLE:
-            self._build_faiss_index()
-            
-        if debug:
-            print(f"DEBUG - Added {len(documents)} documents to vector store collection '{collection_name}'")
+        new_rows = embeddings[list(append_positions.values())]
+        row_count = first_new_row + len(new_rows)
+        self._emb_buffer = _append_rows(self._emb_buffer, first_new_row, new_rows)
+        self._emb_matrix = self._emb_buffer[:row_count]
+        if self._unit_matrix is not None:
+            self._unit_buffer = _append_rows(self._unit_buffer, first_new_row, _normalize_rows(new_rows))
+            self._unit_matrix = self._unit_buffer[:row_count]
+        
+        for doc_id in append_positions:
+            self._id_to_row[doc_id] = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+        
+        return first_new_row, replaced
+    
+    def _copy_buffers(self) -> None:
+        """Copy the embedding buffers so rows can be replaced without touching published ones."""
+        row_count = len(self._doc_ids)
+        self._emb_buffer = self._emb_buffer.copy()
+        self._emb_matrix = self._emb_buffer[:row_count]
+        if self._unit_buffer is not None:
+            self._unit_buffer = self._unit_buffer.copy()
+            self._unit_matrix = self._unit_buffer[:row_count]
+    
+    def _publish_snapshot(self) -> None:
+        """
+        Publish the current contents of the store for searches to read.
+        
+        Nothing is copied: the id lists, the documents dict and the matrices
+        are only ever appended to past the published rows, and replacing a
+        stored document copies the dict and matrices first, so a search that
+        took an older snapshot keeps seeing consistent data as long as it
+        reads no further than its own emb_matrix. Call with the write lock held.
+        """
+        unit_matrix = None
+        if self.metric == "cosine" and self._doc_ids:
+            unit_matrix = self._get_unit_rows()
+        
+        self._snapshot = (
+            self.faiss_index, self.faiss_doc_ids, self._doc_ids,
+            self._emb_matrix, unit_matrix, self.documents, self.metric
+        )
+    
+    def _set_rows(self, doc_ids: List[str], embeddings: np.ndarray) -> None:
+        """
+        Replace the stored embedding matrix.
+        
+        Args:
+            doc_ids: Document id for each row
+            embeddings: float32 matrix with one row per document
+        """
+        self._doc_ids = list(doc_ids)
+        self._id_to_row = {doc_id: row for row, doc_id in enumerate(self._doc_ids)}
+        self._emb_buffer = self._emb_matrix = embeddings if self._doc_ids else None
+        self._unit_buffer = self._unit_matrix = None
+    
+    def _get_unit_rows(self) -> np.ndarray:
+        """
+        Get the stored embeddings scaled to unit length, for cosine similarity.
+        
+        The stored rows keep their original values so the collection can be
+        searched with either metric; the normalized copy is built on first
+        use and then kept up to date as rows are added or replaced.
+        
+        Returns:
+            float32 matrix of unit-length rows
+        """
+        if self._unit_matrix is None:
+            self._unit_buffer = self._unit_matrix = _normalize_rows(self._emb_matrix)
+        return self._unit_matrix
     
     def _save_collection(self, collection_name: str) -> None:
         """
@@ -102,20 +435,59 @@ class SimpleVectorStore:
                 "doc_id": doc.doc_id
             }
         
-        with open(os.path.join(collection_dir, "documents.json"), 'w') as f:
-            json.dump(documents_data, f)
+        _write_json(os.path.join(collection_dir, "documents.json"), documents_data)
         
-        # Save embeddings
-        embeddings_data = {}
-        for doc_id, emb in self.embeddings.items():
-            embeddings_data[doc_id] = emb
+        # Save embeddings as a plain float32 matrix plus the id of each row
+        _write_json(os.path.join(collection_dir, "doc_ids.json"), self._doc_ids)
         
-        np.save(os.path.join(collection_dir, "embeddings.npy"), embeddings_data)
+        embeddings_array = self._emb_matrix
+        if embeddings_array is None:
+            embeddings_array = np.zeros((0, 0), dtype=np.float32)
+        
+        # Write a new file and swap it in, since the old one may still be mapped
+        embeddings_path = os.path.join(collection_dir, "embeddings.npy")
+        with open(embeddings_path + ".tmp", 'wb') as f:
+            np.save(f, embeddings_array)
+        os.replace(embeddings_path + ".tmp", embeddings_path)
+        
+        # Save the FAISS index so loading does not have to rebuild it
+        index_path = os.path.join(collection_dir, "faiss.index")
+        if FAISS_AVAILABLE and self.faiss_index is not None:
+            n = self.faiss_index.ntotal
+            saved_rows = self._faiss_saved_rows.get(index_path)
+            if saved_rows is None or n >= 2 * saved_rows:
+                index = self.faiss_index
+                if self._faiss_on_gpu:
+                    index = faiss.index_gpu_to_cpu(index)
+                faiss.write_index(index, index_path + ".tmp")
+                os.replace(index_path + ".tmp", index_path)
+                self._faiss_saved_rows[index_path] = n
+        elif os.path.exists(index_path):
+            # The embeddings changed without an index to match
+            os.remove(index_path)
+            self._faiss_saved_rows.pop(index_path, None)
     
     def load_collection(self, collection_name: str = "default", debug: bool = False) -> bool:
         """
         Load a collection from disk.
         
+        Args:
+            collection_name: Name of the collection
+            debug: Whether to print debug information
+            
+        Returns:
+            True if the collection was loaded, False otherwise
+        """
+        with self._write_lock:
+            if not self._load_collection(collection_name, debug):
+                return False
+            self._publish_snapshot()
+            return True
+    
+    def _load_collection(self, collection_name: str, debug: bool) -> bool:
+        """
+        Load a collection from disk into the store without publishing it.
+        
         Args:
             collection_name: Name of the collection
             debug: Whether to print debug information
@@ -134,8 +506,7 @@ class SimpleVectorStore:
             return False
         
         # Load documents
-        with open(documents_path, 'r') as f:
-            documents_data = json.load(f)
+        documents_data = _read_json(documents_path)
         
         self.documents = {}
         for doc_id, doc_data in documents_data.items():
@@ -146,41 +517,263 @@ class SimpleVectorStore:
             )
         
         # Load embeddings
-        self.embeddings = np.load(embeddings_path, allow_pickle=True).item()
+        doc_ids_path = os.path.join(collection_dir, "doc_ids.json")
+        if os.path.exists(doc_ids_path):
+            doc_ids = _read_json(doc_ids_path)
+            
+            # Copy-on-write mapping: pages are read on demand and shared with
+            # other processes, and in-place updates never reach the file
+            mmap_mode = 'c' if self.mmap and doc_ids else None
+            self._set_rows(doc_ids, np.load(embeddings_path, mmap_mode=mmap_mode))
+        else:
+            # Collections saved before doc_ids.json existed pickled an id -> list dict
+            embeddings_data = np.load(embeddings_path, allow_pickle=True).item()
+            doc_ids = list(embeddings_data.keys())
+            self._set_rows(doc_ids, np.array(
+                [embeddings_data[doc_id] for doc_id in doc_ids], dtype=np.float32
+            ))
         
-        # Rebuild FAISS index if available
+        # Load the saved FAISS index, or rebuild it if it does not match
         if FAISS_AVAILABLE:
-            self._build_faiss_index()
+            self.faiss_index = None
+            if not self._load_faiss_index(os.path.join(collection_dir, "faiss.index")):
+                self._build_faiss_index()
+            elif debug:
+                print(f"DEBUG - Loaded saved FAISS index for collection '{collection_name}'")
         
         if debug:
             print(f"DEBUG - Loaded collection '{collection_name}' with {len(self.documents)} documents")
         
         return True
     
+    def _load_faiss_index(self, index_path: str) -> bool:
+        """
+        Load a saved FAISS index if it matches the stored embeddings.
+        
+        The index may have been saved before the last rows were appended;
+        those rows are added to it from the stored embeddings.
+        
+        Args:
+            index_path: Path of the saved index
+            
+        Returns:
+            True if the index was loaded, False if it must be rebuilt
+        """
+        if not self._doc_ids or not os.path.exists(index_path):
+            return False
+        
+        try:
+            index = faiss.read_index(index_path)
+        except RuntimeError:
+            return False
+        
+        n = len(self._doc_ids)
+        dim = self._emb_matrix.shape[1]
+        expected = self._create_faiss_index(dim, n)
+        if (type(index) is not type(expected) or index.ntotal > n
+                or index.d != dim or index.metric_type != expected.metric_type):
+            return False
+        
+        saved_rows = index.ntotal
+        if saved_rows < n:
+            index.add(self._index_rows(saved_rows))
+        
+        self._place_faiss_index(index, n)
+        self._faiss_saved_rows = {index_path: saved_rows}
+        self.faiss_doc_ids = list(self._doc_ids)
+        self._faiss_index_key = (self._resolve_index_type(dim, n), self.metric)
+        self._faiss_trained_size = 0 if expected.is_trained else n
+        return True
+    
+    def _index_rows(self, start: int = 0) -> np.ndarray:
+        """
+        Get stored embedding rows in the form the FAISS index holds them.
+        
+        Args:
+            start: First row to return
+            
+        Returns:
+            float32 rows from start onwards, normalized for cosine similarity
+        """
+        if self.metric == "cosine":
+            return self._get_unit_rows()[start:]
+        return self._emb_matrix[start:]
+    
+    def _update_faiss_index(self, first_new_row: int, replaced: bool) -> None:
+        """
+        Bring the FAISS index up to date after rows were stored.
+        
+        Appended rows are added to the existing index. The index is rebuilt
+        instead when stored rows were replaced, when the collection has grown
+        into a different index type, or when a trained index has more than
+        doubled in size since it was trained.
+        
+        Args:
+            first_new_row: Index of the first appended row
+            replaced: Whether any stored row was replaced in place
+        """
+        if not self._doc_ids:
+            return
+        
+        n = len(self._doc_ids)
+        dim = self._emb_matrix.shape[1]
+        if (self.faiss_index is None or replaced
+                or self._faiss_index_key != (self._resolve_index_type(dim, n), self.metric)
+                or (self._faiss_trained_size and n > 2 * self._faiss_trained_size)):
+            self._build_faiss_index()
+            return
+        
+        if first_new_row < n:
+            # Searches may still use the published index, so add to a copy;
+            # copying is far cheaper than rebuilding
+            if self._faiss_on_gpu:
+                index = faiss.index_gpu_to_cpu(self.faiss_index)
+            else:
+                index = faiss.clone_index(self.faiss_index)
+            index.add(self._index_rows(first_new_row))
+            self._place_faiss_index(index, n)
+            self.faiss_doc_ids.extend(self._doc_ids[first_new_row:])
+    
     def _build_faiss_index(self) -> None:
         """Build a FAISS index for fast vector similarity search."""
-        if not FAISS_AVAILABLE or not self.embeddings:
+        if not FAISS_AVAILABLE or not self._doc_ids:
             return
         
-        # Convert embeddings to numpy array
-        doc_ids = list(self.embeddings.keys())
-        embeddings_array = np.array([self.embeddings[doc_id] for doc_id in doc_ids])
+        doc_ids = list(self._doc_ids)
+        embeddings_array = self._index_rows()
         dim = embeddings_array.shape[1]
         
-        # Create index based on metric
-        if self.metric == "cosine":
-            # Normalize vectors for cosine similarity
-            faiss.normalize_L2(embeddings_array)
-            self.faiss_index = faiss.IndexFlatIP(dim)
-        else:
-            # L2 distance
-            self.faiss_index = faiss.IndexFlatL2(dim)
+        self._place_faiss_index(self._create_faiss_index(dim, len(doc_ids)), len(doc_ids))
+        self._faiss_trained_size = 0
+        if not self.faiss_index.is_trained:
+            self.faiss_index.train(embeddings_array)
+            self._faiss_trained_size = len(doc_ids)
         
         self.faiss_index.add(embeddings_array)
         self.faiss_doc_ids = doc_ids
+        self._faiss_saved_rows.clear()
+        self._faiss_index_key = (self._resolve_index_type(dim, len(doc_ids)), self.metric)
+    
+    def _place_faiss_index(self, index, n: int) -> None:
+        """
+        Make an index the current FAISS index, moving it to a GPU if worthwhile.
+        
+        Indexes of at least 10,000 vectors go to the first GPU when
+        embeddings_faiss_gpu is set and FAISS was built with GPU support.
+        Index types without a GPU version, such as HNSW, stay on the CPU.
+        
+        Args:
+            index: FAISS index on the CPU
+            n: Number of vectors the index will hold
+        """
+        self.faiss_index = index
+        self._faiss_on_gpu = False
+        
+        if (not self.use_gpu or n < 10_000
+                or not hasattr(faiss, "StandardGpuResources") or faiss.get_num_gpus() == 0):
+            return
+        
+        if self._gpu_resources is None:
+            self._gpu_resources = faiss.StandardGpuResources()
+        try:
+            self.faiss_index = faiss.index_cpu_to_gpu(self._gpu_resources, 0, index)
+            self._faiss_on_gpu = True
+        except RuntimeError:
+            # No GPU implementation for this index type
+            pass
+    
+    def _create_faiss_index(self, dim: int, n: int):
+        """
+        Create an empty FAISS index suited to the collection size.
+        
+        Small collections use an exact flat index. Larger ones use HNSW,
+        and very large ones IVF-PQ, trading a little recall for sub-linear
+        search time. embeddings_index_type can force "flat", "hnsw" or
+        "ivfpq" instead of "auto".
+        
+        With embeddings_quantize set to "sq8", flat and HNSW indexes store
+        8-bit scalar-quantized vectors instead of float32, and IVF uses SQ8
+        codes instead of PQ. embeddings_refine then re-ranks the candidates
+        against the exact float32 vectors.
+        
+        Args:
+            dim: Embedding dimensionality
+            n: Number of vectors the index will hold
+            
+        Returns:
+            The FAISS index; quantized indexes still need training
+        """
+        index = self._create_base_faiss_index(dim, n)
+        if self.quantize == "sq8" and self.refine:
+            index = faiss.IndexRefineFlat(index)
+            index.k_factor = 4
+        return index
+    
+    def _resolve_index_type(self, dim: int, n: int) -> str:
+        """
+        Decide which kind of FAISS index a collection should use.
+        
+        Args:
+            dim: Embedding dimensionality
+            n: Number of vectors the index will hold
+            
+        Returns:
+            "flat", "hnsw" or "ivfpq"
+        """
+        index_type = self.index_type
+        if index_type == "auto":
+            if n < 2000:
+                index_type = "flat"
+            elif n < 1_000_000:
+                index_type = "hnsw"
+            else:
+                index_type = "ivfpq"
+        
+        # PQ16 splits vectors into 16 sub-vectors and needs enough points to train
+        if index_type == "ivfpq" and ((dim % 16 != 0 and self.quantize != "sq8") or n < 10_000):
+            index_type = "hnsw"
+        
+        return index_type
+    
+    def _create_base_faiss_index(self, dim: int, n: int):
+        """
+        Create the FAISS index chosen by _create_faiss_index, without refinement.
+        
+        Args:
+            dim: Embedding dimensionality
+            n: Number of vectors the index will hold
+            
+        Returns:
+            The FAISS index
+        """
+        index_type = self._resolve_index_type(dim, n)
+        sq8 = self.quantize == "sq8"
+        metric = faiss.METRIC_INNER_PRODUCT if self.metric == "cosine" else faiss.METRIC_L2
+        
+        if index_type == "hnsw":
+            if sq8:
+                index = faiss.IndexHNSWSQ(dim, faiss.ScalarQuantizer.QT_8bit, 32, metric)
+            else:
+                index = faiss.IndexHNSWFlat(dim, 32, metric)
+            index.hnsw.efConstruction = 100
+            index.hnsw.efSearch = 64
+            return index
+        
+        if index_type == "ivfpq":
+            nlist = max(int(2 * math.sqrt(n)), 20)
+            codes = "SQ8" if sq8 else "PQ16x8"
+            index = faiss.index_factory(dim, f"IVF{nlist},{codes}", metric)
+            index.nprobe = max(1, min(nlist // 4, 10))
+            return index
+        
+        if sq8:
+            return faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit, metric)
+        if self.metric == "cosine":
+            return faiss.IndexFlatIP(dim)
+        return faiss.IndexFlatL2(dim)
     
     def similarity_search(self, 
-                         query_embedding: List[float], 
+                         query_embedding: Union[List[float], np.ndarray], 
                          k: int = 5,
                          debug: bool = False) -> List[Tuple[Document, float]]:
         """
@@ -194,77 +787,139 @@ class SimpleVectorStore:
         Returns:
             List of (document, similarity_score) tuples
         """
-        if not self.embeddings:
+        query_matrix = np.array(query_embedding, dtype=np.float32, ndmin=2)
+        return self.similarity_search_batch(query_matrix, k, debug=debug)[0]
+    
+    def similarity_search_batch(self, 
+                                query_embeddings: Union[List[List[float]], np.ndarray], 
+                                k: int = 5,
+                                debug: bool = False) -> List[List[Tuple[Document, float]]]:
+        """
+        Find similar documents for several query embeddings at once.
+        
+        With FAISS the whole query matrix goes to a single index search,
+        which spreads the queries over the available CPU cores.
+        
+        Args:
+            query_embeddings: Query embedding vectors, one per row
+            k: Number of results to return per query
+            debug: Whether to print debug information
+            
+        Returns:
+            One list of (document, similarity_score) tuples per query
+        """
+        # Always a copy, since cosine search normalizes it in place
+        query_matrix = np.array(query_embeddings, dtype=np.float32, ndmin=2)
+        
+        # Read only this snapshot, so concurrent writes cannot be seen half done
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[3] is None:
             if debug:
                 print("DEBUG - No embeddings available for search")
-            return []
+            return [[] for _ in range(len(query_matrix))]
         
-        k = min(k, len(self.embeddings))
+        faiss_index, faiss_doc_ids, _, emb_matrix, _, documents, metric = snapshot
+        k = min(k, len(emb_matrix))
         
-        if FAISS_AVAILABLE and self.faiss_index is not None:
+        if FAISS_AVAILABLE and faiss_index is not None:
             # Use FAISS for fast search
-            query_embedding_array = np.array([query_embedding]).astype('float32')
-            
-            if self.metric == "cosine":
-                # Normalize query for cosine similarity
-                faiss.normalize_L2(query_embedding_array)
-                similarities, indices = self.faiss_index.search(query_embedding_array, k)
+            if metric == "cosine":
+                # Normalize queries for cosine similarity
+                faiss.normalize_L2(query_matrix)
+                similarities, indices = faiss_index.search(query_matrix, k)
                 
-                results = []
-                for i, idx in enumerate(indices[0]):
-                    if idx < len(self.faiss_doc_ids):
-                        doc_id = self.faiss_doc_ids[idx]
-                        score = similarities[0][i]  # Higher is better for cosine
-                        results.append((self.documents[doc_id], score))
+                batch_results = []
+                for row_similarities, row_indices in zip(similarities, indices):
+                    results = []
+                    for i, idx in enumerate(row_indices):
+                        if 0 <= idx < len(faiss_doc_ids):
+                            doc_id = faiss_doc_ids[idx]
+                            score = row_similarities[i]  # Higher is better for cosine
+                            results.append((documents[doc_id], score))
+                    batch_results.append(results)
                 
                 if debug:
-                    print(f"DEBUG - Found {len(results)} documents using FAISS cosine similarity search")
+                    print(f"DEBUG - Found {sum(map(len, batch_results))} documents for {len(query_matrix)} queries using FAISS cosine similarity search")
                 
-                return results
+                return batch_results
             else:
                 # L2 distance (lower is better)
-                distances, indices = self.faiss_index.search(query_embedding_array, k)
+                distances, indices = faiss_index.search(query_matrix, k)
                 
-                results = []
-                for i, idx in enumerate(indices[0]):
-                    if idx < len(self.faiss_doc_ids):
-                        doc_id = self.faiss_doc_ids[idx]
-                        score = 1.0 / (1.0 + distances[0][i])  # Convert distance to similarity
-                        results.append((self.documents[doc_id], score))
+                batch_results = []
+                for row_distances, row_indices in zip(distances, indices):
+                    results = []
+                    for i, idx in enumerate(row_indices):
+                        if 0 <= idx < len(faiss_doc_ids):
+                            doc_id = faiss_doc_ids[idx]
+                            score = 1.0 / (1.0 + row_distances[i])  # Convert distance to similarity
+                            results.append((documents[doc_id], score))
+                    batch_results.append(results)
                 
                 if debug:
-                    print(f"DEBUG - Found {len(results)} documents using FAISS L2 distance search")
+                    print(f"DEBUG - Found {sum(map(len, batch_results))} documents for {len(query_matrix)} queries using FAISS L2 distance search")
                 
-                return results
+                return batch_results
         else:
             # Fallback to numpy
             if debug:
                 print("DEBUG - FAISS not available, using numpy for similarity search")
-                
-            scores = []
-            for doc_id, embedding in self.embeddings.items():
-                if self.metric == "cosine":
-                    # Cosine similarity
-                    similarity = np.dot(query_embedding, embedding) / (
-                        np.linalg.norm(query_embedding) * np.linalg.norm(embedding)
-                    )
-                else:
-                    # L2 distance
-                    distance = np.linalg.norm(np.array(query_embedding) - np.array(embedding))
-                    similarity = 1.0 / (1.0 + distance)  # Convert distance to similarity
-                
-                scores.append((doc_id, similarity))
             
-            # Sort by similarity (highest first)
-            scores.sort(key=lambda x: x[1], reverse=True)
-            
-            # Return top k
-            results = [(self.documents[doc_id], score) for doc_id, score in scores[:k]]
+            batch_results = [self._numpy_search(snapshot, query, k) for query in query_matrix]
             
             if debug:
-                print(f"DEBUG - Found {len(results)} documents using numpy similarity search")
+                print(f"DEBUG - Found {sum(map(len, batch_results))} documents for {len(query_matrix)} queries using numpy similarity search")
                 
-            return results
+            return batch_results
+    
+    def _numpy_search(self, snapshot: tuple, query: np.ndarray, k: int) -> List[Tuple[Document, float]]:
+        """
+        Find the k most similar documents to one query without FAISS.
+        
+        Args:
+            snapshot: Published store contents to search
+            query: float32 query embedding
+            k: Number of results to return (at most the collection size)
+            
+        Returns:
+            List of (document, similarity_score) tuples
+            
+        Raises:
+            ValueError: If the query and the stored embeddings differ in dimensionality
+        """
+        _, _, doc_ids, emb_matrix, unit_matrix, documents, metric = snapshot
+        
+        # The compiled kernel does no bounds checking, so check here
+        if len(query) != emb_matrix.shape[1]:
+            raise ValueError(
+                f"Query embedding has {len(query)} dimensions but the collection has {emb_matrix.shape[1]}"
+            )
+        
+        # Score every document with one matrix operation
+        if metric == "cosine":
+            # Cosine similarity; an all-zero query scores 0, as with FAISS
+            query_norm = np.linalg.norm(query)
+            scores = unit_matrix @ query
+            if query_norm > 0:
+                scores /= query_norm
+        else:
+            # L2 distance
+            if NUMBA_AVAILABLE:
+                distances = np.empty(len(emb_matrix), dtype=np.float32)
+                _squared_l2_kernel(emb_matrix.shape[1])(np.ascontiguousarray(emb_matrix), query, distances)
+                distances = np.sqrt(distances)
+            else:
+                distances = np.linalg.norm(emb_matrix - query, axis=1)
+            scores = 1.0 / (1.0 + distances)  # Convert distance to similarity
+        
+        # Select the k best in linear time, then sort only those (highest first)
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.lexsort((top, -scores[top]))]
+        else:
+            top = np.argsort(-scores, kind='stable')
+        
+        return [(documents[doc_ids[i]], float(scores[i])) for i in top]
 
 
 class Embedder:
@@ -284,16 +939,21 @@ class Embedder:
         """
         self.config = config or Config()
         self.model_name = self.config["embeddings_model"]
+        self.batch_size = self.config.get("embeddings_batch_size", 64)
+        
+        # Embeddings are deterministic, so cached entries never expire
+        self._cache = TTLCache(maxsize=self.config.get("embeddings_cache_size", 4096), ttl=float("inf"))
         
         try:
             from sentence_transformers import SentenceTransformer
-            self.model = SentenceTransformer(self.model_name)
+            # None lets sentence-transformers pick CUDA when it is available
+            self.model = SentenceTransformer(self.model_name, device=self.config.get("embeddings_device"))
             self.use_sentence_transformers = True
         except ImportError:
             print("WARNING: sentence-transformers not available, using simple fallback embedding")
             self.use_sentence_transformers = False
     
-    def embed_texts(self, texts: List[str], debug: bool = False) -> List[List[float]]:
+    def embed_texts(self, texts: List[str], debug: bool = False) -> np.ndarray:
         """
         Create embeddings for a list of texts.
         
@@ -302,34 +962,115 @@ class Embedder:
             debug: Whether to print debug information
             
         Returns:
-            List of embedding vectors
+            float32 matrix with one embedding per row
         """
         if self.use_sentence_transformers:
             # Use sentence-transformers for high-quality embeddings
             if debug:
                 print(f"DEBUG - Creating {len(texts)} embeddings using sentence-transformers model '{self.model_name}'")
                 
-            embeddings = self.model.encode(texts)
-            return embeddings.tolist()
+            embeddings = self.model.encode(texts, convert_to_numpy=True)
+            return embeddings.astype(np.float32, copy=False)
         else:
             # Simple fallback using word frequency
             if debug:
                 print(f"DEBUG - Creating {len(texts)} embeddings using simple fallback method")
                 
-            return [self._simple_embed(text) for text in texts]
+            return np.array([self._simple_embed(text) for text in texts], dtype=np.float32)
+    
+    def embed_texts_batched(self, 
+                            texts: List[str], 
+                            batch_size: Optional[int] = None,
+                            debug: bool = False) -> np.ndarray:
+        """
+        Create embeddings for many texts at once.
+        
+        The model encodes the texts in batches of batch_size, and the result
+        stays a float32 matrix instead of being converted to Python lists.
+        
+        Args:
+            texts: List of text strings
+            batch_size: Texts per model batch (None means use config default)
+            debug: Whether to print debug information
+            
+        Returns:
+            float32 matrix with one embedding per row
+        """
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        
+        if self.use_sentence_transformers:
+            if debug:
+                print(f"DEBUG - Creating {len(texts)} embeddings in batches using sentence-transformers model '{self.model_name}'")
+            
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size or self.batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+            return embeddings.astype(np.float32, copy=False)
+        
+        return self.embed_texts(texts, debug=debug)
     
-    def embed_text(self, text: str, debug: bool = False) -> List[float]:
+    def embed_text(self, text: str, debug: bool = False) -> np.ndarray:
         """
         Create an embedding for a single text.
         
+        Repeated texts are answered from an LRU cache without running the
+        model again.
+        
         Args:
             text: Text string
             debug: Whether to print debug information
             
         Returns:
-            Embedding vector
+            float32 embedding vector; read-only, since it is shared with the cache
+        """
+        embedding = self._cache.get(text)
+        if embedding is None:
+            embedding = self.embed_texts([text], debug=debug)[0]
+            embedding.setflags(write=False)
+            self._cache.set(text, embedding)
+        elif debug:
+            print("DEBUG - Using cached embedding")
+        
+        return embedding
+    
+    def embed_texts_cached(self, texts: List[str], debug: bool = False) -> np.ndarray:
+        """
+        Create embeddings for several texts, sharing embed_text's cache.
+        
+        Cached texts are looked up, and the rest are embedded in one batch
+        and added to the cache.
+        
+        Args:
+            texts: List of text strings
+            debug: Whether to print debug information
+            
+        Returns:
+            float32 matrix with one embedding per row
         """
-        return self.embed_texts([text], debug=debug)[0]
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        
+        embeddings = {}
+        for text in texts:
+            embedding = self._cache.get(text)
+            if embedding is not None:
+                embeddings[text] = embedding
+        
+        missing = [text for text in dict.fromkeys(texts) if text not in embeddings]
+        if debug:
+            print(f"DEBUG - {len(missing)} of {len(texts)} texts not found in embedding cache")
+        
+        if missing:
+            for text, embedding in zip(missing, self.embed_texts_batched(missing, debug=debug)):
+                embedding.setflags(write=False)
+                self._cache.set(text, embedding)
+                embeddings[text] = embedding
+        
+        return np.stack([embeddings[text] for text in texts])
     
     def _simple_embed(self, text: str, dim: int = 100) -> List[float]:
         """
@@ -344,33 +1085,25 @@ class Embedder:
         Returns:
             Embedding vector
         """
-        import hashlib
-        
         # Normalize text
         text = text.lower()
         words = text.split()
         
         # Count words
-        word_counts = {}
-        for word in words:
-            word_counts[word] = word_counts.get(word, 0) + 1
+        word_counts = Counter(words)
         
-        # Create embedding
-        embedding = [0.0] * dim
-        for word, count in word_counts.items():
-            # Hash the word to get indices
-            hash_val = int(hashlib.md5(word.encode()).hexdigest(), 16)
-            idx = hash_val % dim
-            
-            # Add count to embedding
-            embedding[idx] += count
+        # Create embedding by adding each word's count at its hashed index
+        indices = [_word_bucket(word, dim) for word in word_counts]
+        embedding = np.bincount(
+            indices, weights=list(word_counts.values()), minlength=dim
+        ).astype(np.float64)
         
         # Normalize
         norm = np.linalg.norm(embedding)
         if norm > 0:
-            embedding = [e / norm for e in embedding]
+            embedding = embedding / norm
         
-        return embedding
+        return embedding.tolist()
 
 
 class RetrieverRag:
@@ -456,7 +1189,8 @@ class RetrieverRag:
         self._lazy_init()
         
         # Process content from research results
-        for i, item in enumerate(research_data.get("content", [])):
+        documents = []
+        for item in research_data.get("content", []):
             content = item.get("content", "")
             url = item.get("url", "")
             title = item.get("title", "")
@@ -466,24 +1200,52 @@ class RetrieverRag:
                 
             if debug:
                 print(f"DEBUG - Adding web content from {url} to vector store")
-                
-            # Add to RAG
-            self.add_web_content(content, url, title, debug=debug)
+            
+            item_documents = self.document_processor.process_text_from_web(content, url, title)
+            if not item_documents and debug:
+                print(f"DEBUG - No documents created from {url}")
+            documents.extend(item_documents)
+        
+        if not documents:
+            return
+        
+        # Embed every page's chunks in one batch and store them with one write
+        embeddings = self.embedder.embed_texts_batched([doc.text for doc in documents], debug=debug)
+        self.vector_store.add_embeddings(documents, embeddings, debug=debug)
+        
+        if debug:
+            print(f"DEBUG - Added {len(documents)} documents from research results to vector store")
     
-    def query(self, query: str, k: int = 5, debug: bool = False) -> List[Document]:
+    def query(self, 
+              query: Union[str, List[str]], 
+              k: int = 5, 
+              debug: bool = False) -> Union[List[Document], List[List[Document]]]:
         """
         Query the RAG system.
         
         Args:
-            query: The query text
-            k: Number of results to return
+            query: The query text, or a list of query texts to search in one batch
+            k: Number of results to return per query
             debug: Whether to print debug information
             
         Returns:
-            List of relevant documents
+            List of relevant documents, or one such list per query when
+            a list of queries is given
         """
         self._lazy_init()
         
+        if isinstance(query, list):
+            if not query:
+                return []
+            
+            query_embeddings = self.embedder.embed_texts_cached(query, debug=debug)
+            batch_results = self.vector_store.similarity_search_batch(query_embeddings, k, debug=debug)
+            
+            if debug:
+                print(f"DEBUG - Retrieved documents for {len(query)} queries")
+            
+            return [[doc for doc, score in results] for results in batch_results]
+        
         # Embed query
         query_embedding = self.embedder.embed_text(query, debug=debug)
         
@@ -4,14 +4,107 @@ Web search functionality for research.
 This module provides tools for searching the web and retrieving relevant information.
 """
 
+import os
 import json
 import requests
-from typing import List, Dict, Any, Optional, Set
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Callable, Iterator, Optional, Set, Tuple
 import urllib.parse
 import time
 import re
+import threading
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
 
 from llm_interface.config import Config
+from llm_interface.utils.helpers import TTLCache
+
+
+# Elements whose text is left out of fetched page content
+_NON_CONTENT_TAGS = ("script", "style", "header", "footer", "nav", "aside")
+
+# Patterns and stop words used to extract key terms from search results
+_WORD_RE = re.compile(r'\b\w+\b')
+_LONG_WORD_RE = re.compile(r'\b\w{4,}\b')
+_CAP_RE = re.compile(r'\b[A-Z][a-zA-Z]{3,}\b')
+_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "that", "this", "what", "where",
+    "when", "how", "who", "why", "which", "about", "from"
+})
+
+# Patterns and words used to recognise list queries and list content
+_NUM_RE = re.compile(r'\b\d+\b')
+_NUM_SPACE_RE = re.compile(r'\b\d+\s+')
+_NUMBERED_LIST_RE = re.compile(r'\b\d+\.\s+\w+')
+_BULLET_RE = re.compile(r'[-•*]\s+\w+')
+_LIST_INDICATORS = (
+    "list", "top", "best", "examples", "ways to",
+    "things", "items", "reasons", "methods", "techniques",
+    "tips", "ideas", "options", "alternatives", "types"
+)
+_LIST_TITLE_WORDS = ("list", "top", "best", "comprehensive")
+_LIST_TEXT_WORDS = ("list", "top", "following", "items", "examples")
+
+# Entity types suggested by search results, each with the word searched
+# for; the singular form is a prefix of the plural, so it matches both
+_ENTITY_TYPES = tuple(
+    (entity_type, entity_type[:-1] if entity_type.endswith("s") else entity_type)
+    for entity_type in ("people", "places", "products", "companies", "examples",
+                        "guides", "articles", "resources", "reviews")
+)
+
+# Query parameters that only track where a visitor came from
+_TRACKING_PARAMS = ("fbclid", "gclid")
+
+# Ports that are implied by the scheme when a URL leaves them out
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so trivially different forms of the same page compare equal.
+    
+    The scheme and host are lowercased, the scheme's default port, the
+    fragment, a trailing slash and tracking parameters (utm_*, fbclid,
+    gclid) are removed, and the remaining query parameters are sorted.
+    
+    Args:
+        url: The URL
+        
+    Returns:
+        The canonical form of the URL
+    """
+    try:
+        parts = urllib.parse.urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    
+    scheme, netloc = parts.scheme.lower(), parts.netloc.lower()
+    if port is not None and port == _DEFAULT_PORTS.get(scheme):
+        netloc = netloc.rsplit(":", 1)[0]
+    
+    query = urllib.parse.urlencode(sorted(
+        (key, value) for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith("utm_") and key not in _TRACKING_PARAMS
+    ))
+    return urllib.parse.urlunsplit((
+        scheme, netloc, parts.path.rstrip("/"), query, ""
+    ))
 
 
 class WebSearch:
@@ -30,6 +123,46 @@ class WebSearch:
         """
         self.config = config or Config()
         self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        
+        # Keep-alive session so repeated requests reuse TCP/TLS connections
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": self.user_agent})
+        pool_size = self.config.get("http_pool_size", 32)
+        
+        # Retry transient gateway errors with a short backoff instead of
+        # dropping the result
+        retries = Retry(
+            total=self.config.get("http_retries", 2),
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504]
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Search results and page contents are cached in memory and, with
+        # diskcache installed, on disk; empty results expire sooner so a
+        # failing site is not retried on every call
+        self.cache_ttl = self.config.get("web_cache_ttl", 86400)
+        self.failure_cache_ttl = self.config.get("web_failure_cache_ttl", 3600)
+        self._memory_cache = TTLCache(maxsize=self.config.get("web_memory_cache_size", 512), ttl=self.cache_ttl)
+        self._cache_lock = threading.Lock()
+        self._disk_cache = None
+        self._disk_cache_opened = False
+    
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections, and the disk cache."""
+        self.session.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+    
+    def __enter__(self) -> "WebSearch":
+        """Allow use as a context manager that closes the session on exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the session when leaving a with block."""
+        self.close()
     
     def search(self, query: str, max_results: Optional[int] = None, debug: bool = False) -> List[Dict[str, str]]:
         """
@@ -46,6 +179,29 @@ class WebSearch:
         """
         max_results = max_results or self.config["max_search_results"]
         
+        key = ("search", query, max_results)
+        results = self._get_cached(key)
+        if results is not None:
+            if debug:
+                print(f"DEBUG - Using cached search results for query: {query}")
+            return [dict(result) for result in results]
+        
+        results = self._search(query, max_results, debug=debug)
+        self._set_cached(key, results)
+        return [dict(result) for result in results]
+    
+    def _search(self, query: str, max_results: int, debug: bool = False) -> List[Dict[str, str]]:
+        """
+        Search the web without consulting the cache.
+        
+        Args:
+            query: The search query
+            max_results: Maximum number of results to return
+            debug: Whether to print debug information
+            
+        Returns:
+            List of search result dictionaries with title, snippet, and url keys
+        """
         # Try to import duckduckgo_search if available
         try:
             from duckduckgo_search import DDGS
@@ -93,8 +249,7 @@ class WebSearch:
         url = f"https://api.duckduckgo.com/?q={encoded_query}&format=json&pretty=0"
         
         try:
-            headers = {"User-Agent": self.user_agent}
-            response = requests.get(url, headers=headers, timeout=self.config["timeout"])
+            response = self.session.get(url, timeout=self.config["timeout"])
             response.raise_for_status()
             data = response.json()
             
@@ -152,30 +307,44 @@ class WebSearch:
         Returns:
             The plain text content of the webpage
         """
-        try:
-            headers = {"User-Agent": self.user_agent}
-            response = requests.get(url, headers=headers, timeout=self.config["timeout"])
-            response.raise_for_status()
-            
-            # Import BeautifulSoup for HTML parsing
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
+        key = ("page", _canonicalize_url(url))
+        text = self._get_cached(key)
+        if text is not None:
+            if debug:
+                print(f"DEBUG - Using cached content for {url}")
+            return text
+        
+        text = self._fetch_content(url, debug=debug)
+        self._set_cached(key, text)
+        return text
+    
+    def _fetch_content(self, url: str, debug: bool = False) -> str:
+        """
+        Fetch the content of a webpage without consulting the cache.
+        
+        Args:
+            url: The URL to fetch
+            debug: Whether to print debug information
             
-            # Remove script, style, and other non-content elements
-            for element in soup(["script", "style", "header", "footer", "nav", "aside"]):
-                element.extract()
+        Returns:
+            The plain text content of the webpage, or "" if it could not be fetched
+        """
+        try:
+            # Stream the body so no more than web_max_page_bytes of a huge
+            # page is ever downloaded or held in memory
+            with self.session.get(url, timeout=self.config["timeout"], stream=True) as response:
+                response.raise_for_status()
+                content = self._read_body(response, url, debug=debug)
             
-            # Extract links since they might be important
-            links = []
-            for a in soup.find_all("a", href=True):
-                href = a.get("href", "")
-                if href.startswith("http") and len(href) > 10:
-                    link_text = a.get_text().strip()
-                    if link_text:
-                        links.append(f"Link: {link_text} - {href}")
+            # Parse the raw bytes so the page's own <meta charset> is honoured;
+            # only trust requests' encoding when the server actually sent one
+            content_type = response.headers.get("Content-Type", "").lower()
+            from_encoding = response.encoding if "charset=" in content_type else None
             
-            # Get text
-            text = soup.get_text()
+            if LXML_AVAILABLE:
+                links, text = self._parse_html_lxml(content, from_encoding)
+            else:
+                links, text = self._parse_html_bs4(content, from_encoding)
             
             # Process text to make it more readable
             lines = (line.strip() for line in text.splitlines())
@@ -199,6 +368,192 @@ class WebSearch:
             if debug:
                 print(f"DEBUG - Error fetching content from {url}: {e}")
             return ""
+    
+    def _read_body(self, response: requests.Response, url: str, debug: bool = False) -> bytes:
+        """
+        Read a streamed response body, stopping at web_max_page_bytes.
+        
+        Args:
+            response: Response opened with stream=True
+            url: The URL being fetched
+            debug: Whether to print debug information
+            
+        Returns:
+            The body, or its first web_max_page_bytes bytes
+        """
+        max_bytes = self.config.get("web_max_page_bytes", 2000000)
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if max_bytes and size >= max_bytes:
+                if debug:
+                    print(f"DEBUG - Stopped reading {url} after {size} bytes")
+                break
+        
+        content = b"".join(chunks)
+        return content[:max_bytes] if max_bytes else content
+    
+    def _get_cached(self, key: Tuple) -> Any:
+        """
+        Look up a cached search result list or page content.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            The cached value, or None if there is none
+        """
+        if self.cache_ttl <= 0:
+            return None
+        
+        with self._cache_lock:
+            value = self._memory_cache.get(key)
+        if value is not None:
+            return value
+        
+        disk_cache = self._get_disk_cache()
+        if disk_cache is None:
+            return None
+        
+        value = disk_cache.get(key)
+        if value is not None:
+            # Keep it in memory for the rest of the entry's life on disk
+            _, expire_time = disk_cache.get(key, expire_time=True)
+            if expire_time is not None:
+                with self._cache_lock:
+                    self._memory_cache.set(key, value, ttl=max(0.0, expire_time - time.time()))
+        return value
+    
+    def _set_cached(self, key: Tuple, value: Any) -> None:
+        """
+        Cache a search result list or page content.
+        
+        Args:
+            key: Cache key
+            value: Results or text; empty values are kept for the shorter failure TTL
+        """
+        if self.cache_ttl <= 0:
+            return
+        
+        ttl = self.cache_ttl if value else min(self.failure_cache_ttl, self.cache_ttl)
+        with self._cache_lock:
+            self._memory_cache.set(key, value, ttl=ttl)
+        
+        disk_cache = self._get_disk_cache()
+        if disk_cache is not None:
+            disk_cache.set(key, value, expire=ttl)
+    
+    def _get_disk_cache(self):
+        """
+        Open the on-disk search and page cache on first use.
+        
+        Returns:
+            The cache, or None if diskcache is not installed or the cache
+            directory cannot be opened
+        """
+        if not self._disk_cache_opened:
+            with self._cache_lock:
+                if not self._disk_cache_opened:
+                    if DISKCACHE_AVAILABLE:
+                        cache_dir = os.path.expanduser(
+                            self.config.get("web_cache_dir", "~/.llm_interface/web_cache")
+                        )
+                        try:
+                            self._disk_cache = diskcache.Cache(cache_dir)
+                        except Exception as e:
+                            print(f"Warning: Could not open web cache at {cache_dir}: {e}")
+                    self._disk_cache_opened = True
+        return self._disk_cache
+    
+    def _parse_html_lxml(self, content: bytes, from_encoding: Optional[str]) -> Tuple[List[str], str]:
+        """
+        Extract links and text from a webpage using lxml's own element tree.
+        
+        Non-content elements are dropped from the tree after parsing; the
+        result is the same as with BeautifulSoup, which builds its tree in
+        Python even on top of lxml, at a fraction of the cost.
+        
+        Args:
+            content: Raw page bytes
+            from_encoding: Encoding sent by the server, if any
+            
+        Returns:
+            Tuple of (link lines, page text)
+        """
+        from bs4 import UnicodeDammit
+        
+        # Detect the encoding the same way BeautifulSoup does
+        encoding = UnicodeDammit(content, [from_encoding] if from_encoding else [], is_html=True).original_encoding
+        root = lxml.html.document_fromstring(content, parser=lxml.html.HTMLParser(encoding=encoding))
+        
+        # Remove script, style, and other non-content elements, keeping any
+        # text that follows them
+        for element in list(root.iter(*_NON_CONTENT_TAGS)):
+            element.drop_tree()
+        
+        # Extract links since they might be important
+        links = []
+        for a in root.iter("a"):
+            href = a.get("href")
+            if href is not None and href.startswith("http") and len(href) > 10:
+                link_text = a.text_content().strip()
+                if link_text:
+                    links.append(f"Link: {link_text} - {href}")
+        
+        return links, root.text_content()
+    
+    def _parse_html_bs4(self, content: bytes, from_encoding: Optional[str]) -> Tuple[List[str], str]:
+        """
+        Extract links and text from a webpage using BeautifulSoup.
+        
+        Args:
+            content: Raw page bytes
+            from_encoding: Encoding sent by the server, if any
+            
+        Returns:
+            Tuple of (link lines, page text)
+        """
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(content, 'html.parser', from_encoding=from_encoding)
+        
+        # Remove script, style, and other non-content elements
+        for element in soup(list(_NON_CONTENT_TAGS)):
+            element.extract()
+        
+        # Extract links since they might be important
+        links = []
+        for a in soup.find_all("a", href=True):
+            href = a.get("href", "")
+            if href.startswith("http") and len(href) > 10:
+                link_text = a.get_text().strip()
+                if link_text:
+                    links.append(f"Link: {link_text} - {href}")
+        
+        return links, soup.get_text()
+
+
+_shared_web_search: Optional[WebSearch] = None
+_shared_web_search_lock = threading.Lock()
+
+
+def get_web_search() -> WebSearch:
+    """
+    Get the process-wide WebSearch client shared by the research tools.
+    
+    Tools are called many times per research session; sharing one client
+    keeps its pooled keep-alive connections warm across calls.
+    
+    Returns:
+        Shared WebSearch instance
+    """
+    global _shared_web_search
+    if _shared_web_search is None:
+        with _shared_web_search_lock:
+            if _shared_web_search is None:
+                _shared_web_search = WebSearch()
+    return _shared_web_search
 
 
 class WebResearcher:
@@ -218,6 +573,16 @@ class WebResearcher:
         """
         self.config = config or Config()
         self.web_search = WebSearch(self.config)
+        
+        # Searches and page fetches are network-bound, so they run in threads
+        self.max_concurrency = max(1, self.config.get("web_max_concurrency", 8))
+        self.max_per_host = max(1, self.config.get("web_max_per_host", 2))
+        
+        # Optional spacing between fetches from the same host; other hosts
+        # are never held up by it
+        self.min_host_interval = self.config.get("web_min_host_interval", 0.5)
+        self._host_next_fetch: Dict[str, float] = {}
+        self._host_next_fetch_lock = threading.Lock()
     
     def research(self, query: str, debug: bool = False) -> Dict[str, Any]:
         """
@@ -239,8 +604,9 @@ class WebResearcher:
         if debug:
             print(f"DEBUG - Found {len(primary_results)} primary search results")
         
-        # Track all URLs we've seen to avoid duplicates
-        all_urls = set(r.get("url", "") for r in primary_results if r.get("url"))
+        # Track all URLs we've seen to avoid duplicates, in canonical form so
+        # e.g. a trailing slash or tracking parameters do not count as new
+        all_urls = set(_canonicalize_url(r["url"]) for r in primary_results if r.get("url"))
         all_results = primary_results.copy()
         
         # Extract key terms from initial results
@@ -252,19 +618,25 @@ class WebResearcher:
         if debug:
             print(f"DEBUG - Generated {len(follow_up_queries)} follow-up queries: {follow_up_queries}")
         
-        # Try different query transformations
-        for follow_up_query in follow_up_queries[:7]:  # Limit to top 7 follow-up queries
-            if debug:
+        # Try different query transformations, searching for all of them at once
+        follow_up_queries = follow_up_queries[:7]  # Limit to top 7 follow-up queries
+        if debug:
+            for follow_up_query in follow_up_queries:
                 print(f"DEBUG - Performing follow-up search: {follow_up_query}")
-                
-            secondary_results = self.web_search.search(follow_up_query, max_results=7, debug=debug)
-            
+        
+        follow_up_results = self._run_concurrently(
+            lambda follow_up_query: self.web_search.search(follow_up_query, max_results=7, debug=debug),
+            follow_up_queries
+        )
+        
+        for secondary_results in follow_up_results:
             # Add new results that aren't duplicates
             new_results = []
             for result in secondary_results:
                 url = result.get("url", "")
-                if url and url not in all_urls:
-                    all_urls.add(url)
+                canonical_url = _canonicalize_url(url) if url else ""
+                if url and canonical_url not in all_urls:
+                    all_urls.add(canonical_url)
                     new_results.append(result)
             
             all_results.extend(new_results)
@@ -279,33 +651,30 @@ class WebResearcher:
         content = []
         processed_domains = set()
         
+        # Results from a domain we already have content from are skipped once
+        # enough different domains are covered
+        def domain_covered(result: Dict[str, str], max_domains: int) -> bool:
+            return self._extract_domain(result["url"]) in processed_domains and len(processed_domains) >= max_domains
+        
         # First pass: Try to get content from the most relevant results
-        for result in sorted_results[:20]:  # Examine top 20 results
-            url = result.get("url", "")
-            if not url:
-                continue
+        candidates = [result for result in sorted_results[:20] if result.get("url")]  # Examine top 20 results
+        fetched = self._iter_fetched(candidates, lambda: 15 - len(content),
+                                     lambda result: domain_covered(result, 7), debug=debug)
+        
+        for result, text in fetched:
+            url = result["url"]
                 
             # Extract domain to ensure diversity
             domain = self._extract_domain(url)
             
             # Skip if we already have content from this domain
-            if domain in processed_domains and len(processed_domains) >= 7:
+            if domain_covered(result, 7):
                 continue
-                
-            if debug:
-                print(f"DEBUG - Fetching content from {url}")
-            
-            # Add a small delay to avoid overwhelming the server
-            time.sleep(0.5)
             
-            text = self.web_search.fetch_content(url, debug=debug)
             if text:
                 processed_domains.add(domain)
-                content.append({
-                    "title": result.get("title", ""),
-                    "url": url,
-                    "content": text[:7500]  # Allow for more content per source
-                })
+                # Allow for more content per source
+                content.append(self._content_item(result, text[:7500]))
                 
                 if debug:
                     print(f"DEBUG - Added content from {url} ({len(text)} chars)")
@@ -322,25 +691,22 @@ class WebResearcher:
                 
             list_results = self.web_search.search(list_query, max_results=8, debug=debug)
             
-            for result in list_results:
-                url = result.get("url", "")
-                if not url or url in all_urls:
-                    continue
+            candidates = [result for result in list_results
+                          if result.get("url") and _canonicalize_url(result["url"]) not in all_urls]
+            fetched = self._iter_fetched(candidates, lambda: 20 - len(content),
+                                         lambda result: domain_covered(result, 10), debug=debug)
+            
+            for result, text in fetched:
+                url = result["url"]
                     
                 domain = self._extract_domain(url)
-                if domain in processed_domains and len(processed_domains) >= 10:
+                if domain_covered(result, 10):
                     continue
-                    
-                time.sleep(0.5)
-                text = self.web_search.fetch_content(url, debug=debug)
                 
                 if text and self._contains_list(text):
                     processed_domains.add(domain)
-                    content.append({
-                        "title": result.get("title", ""),
-                        "url": url,
-                        "content": text[:10000]  # Allow longer content for lists
-                    })
+                    # Allow longer content for lists
+                    content.append(self._content_item(result, text[:10000]))
                     
                     if debug:
                         print(f"DEBUG - Added list content from {url}")
@@ -356,20 +722,14 @@ class WebResearcher:
             general_query = self._generalize_query(query)
             general_results = self.web_search.search(general_query, max_results=5, debug=debug)
             
-            for result in general_results:
-                url = result.get("url", "")
-                if not url or url in all_urls:
-                    continue
-                    
-                time.sleep(0.5)
-                text = self.web_search.fetch_content(url, debug=debug)
+            candidates = [result for result in general_results
+                          if result.get("url") and _canonicalize_url(result["url"]) not in all_urls]
+            
+            for result, text in self._iter_fetched(candidates, lambda: 20 - len(content), debug=debug):
+                url = result["url"]
                 
                 if text:
-                    content.append({
-                        "title": result.get("title", ""),
-                        "url": url,
-                        "content": text[:7500]
-                    })
+                    content.append(self._content_item(result, text[:7500]))
                     
                     if debug:
                         print(f"DEBUG - Added general content from {url}")
@@ -387,6 +747,138 @@ class WebResearcher:
             "timestamp": time.time()
         }
     
+    def _content_item(self, result: Dict[str, str], text: str) -> Dict[str, Any]:
+        """
+        Build a research content entry for a fetched page.
+        
+        Whether the text contains a list is worked out once here rather
+        than every time the research is formatted for a prompt.
+        
+        Args:
+            result: Search result the page was found through
+            text: Page text to keep
+            
+        Returns:
+            Content dictionary with title, url, content, and is_list keys
+        """
+        return {
+            "title": result.get("title", ""),
+            "url": result["url"],
+            "content": text,
+            "is_list": self._contains_list(text)
+        }
+    
+    def _run_concurrently(self, func, items: List[Any]) -> List[Any]:
+        """
+        Call a function on every item using a thread pool.
+        
+        Args:
+            func: Function taking one item
+            items: Items to process
+            
+        Returns:
+            Results in the same order as items
+        """
+        if not items:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(len(items), self.max_concurrency)) as executor:
+            return list(executor.map(func, items))
+    
+    def _iter_fetched(self,
+                      candidates: List[Dict[str, str]],
+                      wanted: Callable[[], int],
+                      skip: Optional[Callable[[Dict[str, str]], bool]] = None,
+                      debug: bool = False) -> Iterator[Tuple[Dict[str, str], str]]:
+        """
+        Fetch candidate pages in order, only as many at a time as are needed.
+        
+        Each round fetches the next wanted() candidates concurrently. A
+        candidate whose URL was already fetched, or that skip() rejects
+        when the round starts, is passed over without being fetched, so
+        pages the caller could never use are not downloaded.
+        
+        Args:
+            candidates: Search results with URLs, in the order to use them
+            wanted: Returns how many more pages the caller needs
+            skip: Returns whether a candidate can no longer be used
+            debug: Whether to print debug information
+            
+        Yields:
+            (result, text) pairs in candidate order, with "" as the text
+            of a page that could not be fetched
+        """
+        seen_urls = set()
+        position = 0
+        while position < len(candidates):
+            batch_size = wanted()
+            if batch_size <= 0:
+                return
+            
+            batch = []
+            while position < len(candidates) and len(batch) < batch_size:
+                result = candidates[position]
+                position += 1
+                canonical_url = _canonicalize_url(result["url"])
+                if canonical_url in seen_urls or (skip and skip(result)):
+                    continue
+                seen_urls.add(canonical_url)
+                batch.append(result)
+            
+            pages = self._fetch_pages([result["url"] for result in batch], debug=debug)
+            for result in batch:
+                yield result, pages[result["url"]]
+    
+    def _fetch_pages(self, urls: List[str], debug: bool = False) -> Dict[str, str]:
+        """
+        Fetch the content of several webpages concurrently.
+        
+        Instead of pausing between sequential fetches, at most
+        web_max_per_host pages are fetched from any one host at a time,
+        and fetches from one host start at least web_min_host_interval
+        seconds apart.
+        
+        Args:
+            urls: URLs to fetch
+            debug: Whether to print debug information
+            
+        Returns:
+            Dictionary mapping each URL to its text content ("" if the fetch failed)
+        """
+        urls = list(dict.fromkeys(urls))
+        host_limits = {}
+        for url in urls:
+            if debug:
+                print(f"DEBUG - Fetching content from {url}")
+            host_limits.setdefault(self._extract_domain(url), threading.Semaphore(self.max_per_host))
+        
+        def fetch(url: str) -> str:
+            domain = self._extract_domain(url)
+            with host_limits[domain]:
+                self._wait_for_host(domain)
+                return self.web_search.fetch_content(url, debug=debug)
+        
+        return dict(zip(urls, self._run_concurrently(fetch, urls)))
+    
+    def _wait_for_host(self, domain: str) -> None:
+        """
+        Sleep until a fetch from a host is allowed by web_min_host_interval.
+        
+        Args:
+            domain: Host about to be fetched from
+        """
+        if self.min_host_interval <= 0:
+            return
+        
+        # Reserve the next slot for this host, then wait for ours outside the lock
+        with self._host_next_fetch_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_fetch.get(domain, now))
+            self._host_next_fetch[domain] = start + self.min_host_interval
+        
+        if start > now:
+            time.sleep(start - now)
+    
     def _extract_key_terms(self, 
                          results: List[Dict[str, str]], 
                          original_query: str,
@@ -402,47 +894,21 @@ class WebResearcher:
         Returns:
             Set of key terms
         """
-        terms = set()
-        term_counts = {}
-        
         # Add terms from the original query
-        query_terms = set(re.findall(r'\b\w{4,}\b', original_query.lower()))
-        terms.update(query_terms)
+        terms = set(_LONG_WORD_RE.findall(original_query.lower()))
         
-        # Extract terms from titles and snippets
-        for result in results:
-            title = result.get("title", "")
-            snippet = result.get("snippet", "")
-            
-            # Extract potential key terms
-            text = f"{title} {snippet}"
-            # Remove punctuation and split into words
-            words = re.findall(r'\b\w+\b', text.lower())
-            
-            for word in words:
-                # Skip very short words and common stop words
-                if len(word) <= 3 or word in [
-                    "the", "and", "for", "with", "that", "this", "what", "where", 
-                    "when", "how", "who", "why", "which", "about", "from"
-                ]:
-                    continue
-                    
-                term_counts[word] = term_counts.get(word, 0) + 1
+        # Titles and snippets of all results, space separated so no word
+        # spans two of them
+        text = " ".join(f"{result.get('title', '')} {result.get('snippet', '')}" for result in results)
         
-        # Get terms that appear multiple times
-        for term, count in term_counts.items():
-            if count >= 2:
-                terms.add(term)
+        # Get terms that appear multiple times, skipping very short words
+        # and common stop words
+        words = _WORD_RE.findall(text.lower())
+        term_counts = Counter(word for word in words if len(word) > 3 and word not in _STOPWORDS)
+        terms.update(term for term, count in term_counts.items() if count >= 2)
         
         # Add capitalized terms (potential proper nouns)
-        for result in results:
-            title = result.get("title", "")
-            snippet = result.get("snippet", "")
-            
-            text = f"{title} {snippet}"
-            capitalized_terms = re.findall(r'\b[A-Z][a-zA-Z]{3,}\b', text)
-            for term in capitalized_terms:
-                terms.add(term.lower())
+        terms.update(term.lower() for term in _CAP_RE.findall(text))
         
         if debug:
             print(f"DEBUG - Extracted {len(terms)} key terms: {', '.join(list(terms)[:10])}...")
@@ -468,9 +934,10 @@ class WebResearcher:
         
         # Determine what type of query this is
         is_list_query = self._needs_list_content(original_query)
-        is_how_to_query = "how" in original_query.lower() and "to" in original_query.lower()
-        is_comparison_query = any(term in original_query.lower() for term in ["versus", " vs ", "compare", "difference"])
-        is_definition_query = any(term in original_query.lower() for term in ["what is", "definition", "meaning", "explain"])
+        query_lower = original_query.lower()
+        is_how_to_query = "how" in query_lower and "to" in query_lower
+        is_comparison_query = any(term in query_lower for term in ("versus", " vs ", "compare", "difference"))
+        is_definition_query = any(term in query_lower for term in ("what is", "definition", "meaning", "explain"))
         
         # Use key terms to create more targeted queries
         if key_terms:
@@ -495,9 +962,9 @@ class WebResearcher:
             follow_up_queries.append(f"{original_query} directory")
             
             # Check if the query has a number in it
-            number_match = re.search(r'\b(\d+)\b', original_query)
+            number_match = _NUM_RE.search(original_query)
             if number_match:
-                number = int(number_match.group(1))
+                number = int(number_match.group(0))
                 # Also search for smaller numbers that might yield more results
                 if number > 50:
                     follow_up_queries.append(original_query.replace(str(number), "50"))
@@ -527,14 +994,7 @@ class WebResearcher:
             follow_up_queries.append(f"{original_query} {entity_type}")
         
         # Remove duplicates while preserving order
-        unique_queries = []
-        seen = set()
-        for query in follow_up_queries:
-            if query not in seen:
-                seen.add(query)
-                unique_queries.append(query)
-        
-        return unique_queries
+        return list(dict.fromkeys(follow_up_queries))
     
     def _analyze_entity_types(self, results: List[Dict[str, str]]) -> List[str]:
         """
@@ -546,28 +1006,14 @@ class WebResearcher:
         Returns:
             List of likely entity types
         """
-        # Count occurrences of certain words that suggest entity types
-        entity_words = {
-            "people": 0,
-            "places": 0,
-            "products": 0,
-            "companies": 0,
-            "examples": 0,
-            "guides": 0,
-            "articles": 0,
-            "resources": 0,
-            "reviews": 0,
-        }
+        # Count results mentioning words that suggest entity types
+        entity_words = dict.fromkeys((entity_type for entity_type, _ in _ENTITY_TYPES), 0)
         
         for result in results:
-            title = result.get("title", "").lower()
-            snippet = result.get("snippet", "").lower()
-            text = f"{title} {snippet}"
+            text = f"{result.get('title', '')} {result.get('snippet', '')}".lower()
             
-            for entity_type in entity_words:
-                # Check singular and plural forms
-                singular = entity_type[:-1] if entity_type.endswith("s") else entity_type
-                if singular in text or entity_type in text:
+            for entity_type, word in _ENTITY_TYPES:
+                if word in text:
                     entity_words[entity_type] += 1
         
         # Return the top entity types
@@ -591,7 +1037,8 @@ class WebResearcher:
         """
         # Calculate relevance scores
         scored_results = []
-        query_terms = set(re.findall(r'\b\w+\b', query.lower()))
+        query_terms = set(_WORD_RE.findall(query.lower()))
+        needs_list = self._needs_list_content(query)
         
         for result in results:
             score = 0
@@ -616,10 +1063,10 @@ class WebResearcher:
                     score += 1
             
             # Bonus for list content if query needs a list
-            if self._needs_list_content(query):
-                if any(term in title.lower() for term in ["list", "top", "best", "comprehensive"]):
+            if needs_list:
+                if any(term in title for term in _LIST_TITLE_WORDS):
                     score += 8
-                if re.search(r'\b\d+\s+', title):  # Title contains a number followed by space
+                if _NUM_SPACE_RE.search(title):  # Title contains a number followed by space
                     score += 5
             
             scored_results.append((score, result))
@@ -630,10 +1077,15 @@ class WebResearcher:
         # Return just the results
         return [result for score, result in scored_results]
     
-    def _extract_domain(self, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _extract_domain(url: str) -> str:
         """
         Extract the domain from a URL.
         
+        The domain is lowercased and a leading "www." is dropped, so
+        www.example.com and example.com count as the same source.
+        
         Args:
             url: The URL
             
@@ -641,14 +1093,14 @@ class WebResearcher:
             The domain
         """
         try:
-            from urllib.parse import urlparse
-            return urlparse(url).netloc
-        except:
+            domain = urllib.parse.urlsplit(url).netloc
+        except ValueError:
             # Simple fallback
             parts = url.split("/")
-            if len(parts) > 2:
-                return parts[2]
-            return url
+            domain = parts[2] if len(parts) > 2 else url
+        
+        domain = domain.lower()
+        return domain[4:] if domain.startswith("www.") else domain
     
     def _needs_list_content(self, query: str) -> bool:
         """
@@ -660,20 +1112,12 @@ class WebResearcher:
         Returns:
             True if the query needs list content, False otherwise
         """
-        list_indicators = [
-            "list", "top", "best", "examples", "ways to", 
-            "things", "items", "reasons", "methods", "techniques",
-            "tips", "ideas", "options", "alternatives", "types"
-        ]
+        query_lower = query.lower()
+        if any(indicator in query_lower for indicator in _LIST_INDICATORS):
+            return True
         
         # Check for numbers which often indicate list requests
-        has_number = bool(re.search(r'\b\d+\b', query))
-        
-        for indicator in list_indicators:
-            if indicator in query.lower():
-                return True
-        
-        return has_number
+        return bool(_NUM_RE.search(query))
     
     def _contains_list(self, text: str) -> bool:
         """
@@ -686,14 +1130,14 @@ class WebResearcher:
             True if the text contains a list, False otherwise
         """
         # Check for numbered lists (1., 2., etc.)
-        has_numbered_list = bool(re.search(r'\b\d+\.\s+\w+', text))
+        has_numbered_list = bool(_NUMBERED_LIST_RE.search(text))
         
         # Check for bullet lists
-        has_bullet_list = bool(re.search(r'[-•*]\s+\w+', text))
+        has_bullet_list = bool(_BULLET_RE.search(text))
         
         # Check for list keywords
-        list_indicators = ["list", "top", "following", "items", "examples"]
-        has_list_keywords = any(indicator in text.lower() for indicator in list_indicators)
+        text_lower = text.lower()
+        has_list_keywords = any(indicator in text_lower for indicator in _LIST_TEXT_WORDS)
         
         return has_numbered_list or has_bullet_list or has_list_keywords
     
@@ -708,7 +1152,7 @@ class WebResearcher:
             A more general version of the query
         """
         # Remove specific numbers
-        query = re.sub(r'\b\d+\b', '', query)
+        query = _NUM_RE.sub('', query)
         
         # Remove list-specific terms
         for term in ["list of", "top", "best", "most popular"]:
@@ -749,7 +1193,9 @@ class WebResearcher:
         for i, item in enumerate(research_data.get("content", []), 1):
             # Truncate content to a reasonable size but larger for list content
             content = item.get("content", "")
-            is_list_content = self._contains_list(content)
+            is_list_content = item.get("is_list")
+            if is_list_content is None:
+                is_list_content = self._contains_list(content)
             
             # Allow more content for lists
             max_length = 3000 if is_list_content else 1500
@@ -55,6 +55,9 @@ class ToolRegistry:
     def __init__(self):
         """Initialize an empty tool registry."""
         self.tools = {}
+        
+        # Bumped on every registration so callers can cache tool listings
+        self.version = 0
     
     def register_tool(self, tool: Tool) -> None:
         """
@@ -64,6 +67,7 @@ class ToolRegistry:
             tool: The tool to register
         """
         self.tools[tool.name] = tool
+        self.version += 1
     
     def get_tool(self, name: str) -> Optional[Tool]:
         """
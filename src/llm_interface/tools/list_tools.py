@@ -82,10 +82,10 @@ def enhance_list_items(items: List[Dict[str, Any]], fields_to_enhance: List[str]
     Returns:
         Dictionary with enhanced items
     """
-    from llm_interface.research.web import WebSearch
+    from llm_interface.research.web import get_web_search
     
     enhanced_items = []
-    search = WebSearch()
+    search = get_web_search()
     
     for item in items:
         # Skip if already has all fields
@@ -33,12 +33,12 @@ def search_videos(query: str, platform: str = "youtube", max_results: int = 10):
     Returns:
         Dictionary with video search results
     """
-    from llm_interface.research.web import WebSearch
+    from llm_interface.research.web import get_web_search
     
     # Modify query to specifically target videos on the specified platform
     platform_query = f"{query} {platform} video"
     
-    search = WebSearch()
+    search = get_web_search()
     results = search.search(platform_query, max_results=max_results * 2)  # Request more to filter down
     
     videos = []
@@ -130,7 +130,7 @@ def extract_video_metadata(url: str):
     Returns:
         Dictionary with video metadata
     """
-    from llm_interface.research.web import WebSearch
+    from llm_interface.research.web import get_web_search
     
     if not _is_video_url(url):
         return {
@@ -139,7 +139,7 @@ def extract_video_metadata(url: str):
             "timestamp": time.time()
         }
     
-    search = WebSearch()
+    search = get_web_search()
     content = search.fetch_content(url)
     
     # Extract metadata
@@ -176,12 +176,12 @@ def find_video_playlists(topic: str, platform: str = "youtube", max_results: int
     Returns:
         Dictionary with playlist information
     """
-    from llm_interface.research.web import WebSearch
+    from llm_interface.research.web import get_web_search
     
     # Modify query to specifically target playlists
     playlist_query = f"{topic} {platform} playlist"
     
-    search = WebSearch()
+    search = get_web_search()
     results = search.search(playlist_query, max_results=max_results * 2)
     
     playlists = []
@@ -212,7 +212,7 @@ def find_video_playlists(topic: str, platform: str = "youtube", max_results: int
 
 def _search_youtube_api(query: str, max_results: int, api_key: str) -> Dict[str, Any]:
     """Search YouTube using the API."""
-    import requests
+    from llm_interface.research.web import get_web_search
     
     api_url = "https://www.googleapis.com/youtube/v3/search"
     params = {
@@ -223,7 +223,7 @@ def _search_youtube_api(query: str, max_results: int, api_key: str) -> Dict[str,
         "key": api_key
     }
     
-    response = requests.get(api_url, params=params)
+    response = get_web_search().session.get(api_url, params=params)
     response.raise_for_status()
     data = response.json()
     
@@ -256,12 +256,12 @@ def _search_youtube_api(query: str, max_results: int, api_key: str) -> Dict[str,
 
 def _search_youtube_web(query: str, max_results: int) -> Dict[str, Any]:
     """Search YouTube using web search."""
-    from llm_interface.research.web import WebSearch
+    from llm_interface.research.web import get_web_search
     
     # Modify query to specifically target YouTube videos
     youtube_query = f"{query} site:youtube.com"
     
-    search = WebSearch()
+    search = get_web_search()
     results = search.search(youtube_query, max_results=max_results * 2)
     
     videos = []
@@ -29,9 +29,9 @@ def web_search(query: str, max_results: int = 5):
     Returns:
         Dictionary with search results
     """
-    from llm_interface.research.web import WebSearch
+    from llm_interface.research.web import get_web_search
     
-    search = WebSearch()
+    search = get_web_search()
     results = search.search(query, max_results=max_results)
     
     return {
@@ -55,9 +55,9 @@ def fetch_webpage(url: str):
     Returns:
         Dictionary with extracted content
     """
-    from llm_interface.research.web import WebSearch
+    from llm_interface.research.web import get_web_search
     
-    search = WebSearch()
+    search = get_web_search()
     content = search.fetch_content(url)
     
     return {
@@ -82,9 +82,9 @@ def search_and_read(query: str, max_results: int = 3):
     Returns:
         Dictionary with search results and page content
     """
-    from llm_interface.research.web import WebSearch
+    from llm_interface.research.web import get_web_search
     
-    search = WebSearch()
+    search = get_web_search()
     results = search.search(query, max_results=max_results)
     
     if not results:
@@ -133,7 +133,7 @@ def find_list(topic: str, item_type: str = "examples"):
     Returns:
         Dictionary with list information
     """
-    from llm_interface.research.web import WebSearch
+    from llm_interface.research.web import get_web_search
     
     # Form a search query designed to find lists
     queries = [
@@ -142,7 +142,7 @@ def find_list(topic: str, item_type: str = "examples"):
         f"{topic} {item_type} list"
     ]
     
-    search = WebSearch()
+    search = get_web_search()
     all_results = []
     
     # Try different queries
@@ -16,7 +16,8 @@ from llm_interface.utils.helpers import (
     parse_bool,
     format_exception,
     is_valid_url,
-    sanitize_filename
+    sanitize_filename,
+    TTLCache
 )
 
 __all__ = [
@@ -29,5 +30,6 @@ __all__ = [
     'parse_bool',
     'format_exception',
     'is_valid_url',
-    'sanitize_filename'
+    'sanitize_filename',
+    'TTLCache'
 ]
\ No newline at end of file
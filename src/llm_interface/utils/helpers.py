@@ -10,6 +10,7 @@ import os
 import json
 import uuid
 import time
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Union
 
 
@@ -180,3 +181,78 @@ def sanitize_filename(filename: str) -> str:
         filename = base[:max_length - len(ext)] + ext
     
     return filename
+
+
+
+# Sentinel for distinguishing missing cache entries from cached None values
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    A small LRU cache whose entries expire after a fixed time-to-live.
+    
+    Entries are evicted least-recently-used first once maxsize is reached,
+    and are treated as missing once they are older than ttl seconds.
+    """
+    
+    def __init__(self, maxsize: int = 128, ttl: float = 3600.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Time-to-live for each entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Get a value from the cache.
+        
+        Args:
+            key: Cache key
+            default: Value to return if the key is missing or expired
+            
+        Returns:
+            The cached value, or default
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live for this entry in seconds (None means use the cache default)
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._data.clear()
+    
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a fresh entry exists for the key."""
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __len__(self) -> int:
+        """Number of entries currently held (including any not yet expired out)."""
+        return len(self._data)
@@ -0,0 +1,78 @@
+"""
+Tests for document processing.
+
+This module contains unit tests for the DocumentProcessor cleaning and
+chunking logic.
+"""
+
+import unittest
+
+from llm_interface.config import Config
+from llm_interface.research.document import DocumentProcessor
+
+
+class TestDocumentProcessor(unittest.TestCase):
+    """Tests for the DocumentProcessor class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.processor = DocumentProcessor(Config({
+            "chunk_size": 100,
+            "chunk_overlap": 20
+        }))
+    
+    def test_clean_text_whitespace(self):
+        """Test that every kind of whitespace collapses to one space."""
+        text = " a\tb\r\nc\x0bd\x0ce\xa0f\n\n\ng  "
+        
+        self.assertEqual(self.processor.clean_text(text), "a b c d e f g")
+    
+    def test_chunk_text_sentence_breaks(self):
+        """Test that chunks end on sentence breaks and overlap."""
+        text = " ".join(f"Sentence number {i}." for i in range(40))
+        chunks = self.processor.chunk_text(text)
+        
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks[:-1]:
+            self.assertTrue(chunk.endswith("."))
+        self.assertTrue(text.endswith(chunks[-1]))
+        self.assertIn(chunks[0][-20:], chunks[1])
+    
+    def test_chunk_text_small_chunk_size(self):
+        """Test break windows near the start of the text for small chunks."""
+        text = "Short one. " + "x" * 30 + " tail " + "y" * 200
+        chunks = self.processor.chunk_text(text, chunk_size=40, chunk_overlap=5)
+        
+        # The sentence break before position 40 wins over the word break
+        self.assertEqual(chunks[0], "Short one.")
+        self.assertTrue(all(chunk in text for chunk in chunks))
+    
+    def test_process_document_metadata(self):
+        """Test chunk IDs and metadata for a processed document."""
+        text = "word " * 100
+        documents = self.processor.process_document(text, {"doc_id": "doc"})
+        
+        self.assertEqual(documents[0].doc_id, "doc_chunk_0")
+        self.assertEqual(documents[-1].metadata["chunk_index"], len(documents) - 1)
+        for doc in documents:
+            self.assertEqual(doc.metadata["chunk_count"], len(documents))
+            self.assertEqual(doc.metadata["doc_id"], "doc")
+
+    
+    def test_iter_documents_streams_chunk_count(self):
+        """Test that streamed chunks carry the final chunk count up front."""
+        text = "word " * 100
+        stream = self.processor.iter_documents(text, {"doc_id": "doc"})
+        
+        first = next(stream)
+        rest = list(stream)
+        
+        self.assertEqual(first.metadata["chunk_count"], len(rest) + 1)
+        self.assertEqual(
+            [doc.text for doc in [first] + rest],
+            self.processor.chunk_text(text)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -186,5 +186,49 @@ class TestOllamaClient(unittest.TestCase):
             client.delete_session("invalid_session_id")
 
 
+
+class TestOllamaQueryStream(unittest.TestCase):
+    """Tests for streaming responses from the OllamaClient."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = OllamaClient(model="test-model")
+    
+    def _mock_response(self, mock_post, lines):
+        """Make the mocked request return a response with the given lines."""
+        mock_response = MagicMock()
+        mock_response.iter_lines.return_value = iter(lines)
+        mock_post.return_value = mock_response
+        return mock_response
+    
+    @patch('requests.post')
+    def test_chunks_in_order(self, mock_post):
+        """Test that chunks are yielded in the order they arrive, skipping empty ones."""
+        self._mock_response(mock_post, [
+            b'{"response": "Hello", "done": false}',
+            b'',
+            b'{"response": "", "done": false}',
+            b'{"response": " world", "done": false}',
+            b'{"response": "!", "done": true}'
+        ])
+        
+        chunks = list(self.client.query_stream("Test prompt"))
+        
+        self.assertEqual(chunks, ["Hello", " world", "!"])
+        self.assertTrue(mock_post.call_args.kwargs["stream"])
+        self.assertEqual(mock_post.call_args.kwargs["json"]["model"], "test-model")
+    
+    @patch('requests.post')
+    def test_stops_at_done(self, mock_post):
+        """Test that nothing after the line marked done is read, and the response is closed."""
+        mock_response = self._mock_response(mock_post, [
+            b'{"response": "Hi", "done": true}',
+            b'{"response": " again", "done": false}'
+        ])
+        
+        self.assertEqual(list(self.client.query_stream("Test prompt")), ["Hi"])
+        mock_response.close.assert_called_once()
+
+
 if __name__ == '__main__':
     unittest.main()
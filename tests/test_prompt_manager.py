@@ -0,0 +1,72 @@
+"""
+Tests for prompt management.
+
+This module contains unit tests for the PromptManager template cache
+and prompt formatters.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from llm_interface.config.prompt_manager import PromptManager
+
+
+class TestPromptManager(unittest.TestCase):
+    """Tests for the PromptManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.prompt_file = os.path.join(self.tmpdir.name, "prompts.json")
+        self._write_template("Hello {who}")
+        self.manager = PromptManager(self.prompt_file)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+    
+    def _write_template(self, value):
+        """Write a user prompt file with one test template."""
+        with open(self.prompt_file, 'w') as f:
+            json.dump({"test": {"greeting": {"value": value}}}, f)
+    
+    def test_template_looked_up_once(self):
+        """Test that repeated formatting reuses the cached template."""
+        with patch.object(self.manager, 'get_prompt_value', wraps=self.manager.get_prompt_value) as get_prompt_value:
+            formatter = self.manager.get_formatter("test", "greeting")
+            self.assertEqual(formatter(who="Ada"), "Hello Ada")
+            self.assertEqual(self.manager.format_prompt("test", "greeting", who="Bob"), "Hello Bob")
+            self.manager.get_formatter("test", "greeting")
+        
+        self.assertEqual(get_prompt_value.call_count, 1)
+    
+    def test_reload_drops_cached_template(self):
+        """Test that formatters obtained after reloading use the new template."""
+        self.assertEqual(self.manager.get_formatter("test", "greeting")(who="Ada"), "Hello Ada")
+        
+        self._write_template("Goodbye {who}")
+        self.manager.load_prompts()
+        
+        self.assertEqual(self.manager.get_formatter("test", "greeting")(who="Ada"), "Goodbye Ada")
+    
+    def test_merge_drops_cached_template(self):
+        """Test that merging prompts drops the cached template."""
+        self.manager.get_template("test", "greeting")
+        
+        self.manager._merge_prompts({"test": {"greeting": {"value": "Hi {who}"}}})
+        
+        self.assertEqual(self.manager.get_formatter("test", "greeting")(who="Ada"), "Hi Ada")
+    
+    def test_missing_variable_returns_template(self):
+        """Test that a formatter falls back to the template like format_prompt."""
+        formatter = self.manager.get_formatter("test", "greeting")
+        
+        self.assertEqual(formatter(), "Hello {who}")
+        self.assertEqual(formatter(), self.manager.format_prompt("test", "greeting"))
+
+
+if __name__ == "__main__":
+    unittest.main()
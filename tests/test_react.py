@@ -0,0 +1,153 @@
+"""
+Tests for ReAct research.
+
+This module contains unit tests for the ReActResearcher response parsing.
+"""
+
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm_interface.config import Config
+from llm_interface.research.react import DISKCACHE_AVAILABLE, ReActResearcher
+
+
+class TestBatchedToolSelection(unittest.TestCase):
+    """Tests for parsing batched tool selection responses."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.researcher = ReActResearcher(MagicMock())
+        self.needs = ["python web frameworks", "rust async runtimes"]
+    
+    def test_matches_needs_by_text(self):
+        """Test that items are matched to the needs they echo back."""
+        response = (
+            'Here you go:\n['
+            '{"need": "rust async runtimes", "tool": "web_search", "parameters": {"query": "tokio"}}, '
+            '{"need": "python web frameworks", "tool": "search_and_read", "parameters": {"query": "django"}}'
+            ']'
+        )
+        
+        selections = self.researcher._extract_batched_tool_selection(response, self.needs)
+        
+        self.assertEqual(selections, [
+            ("search_and_read", {"query": "django"}),
+            ("web_search", {"query": "tokio"})
+        ])
+    
+    def test_parameters_with_braces_and_nesting(self):
+        """Test that parameters are kept whole when they contain braces or nested objects."""
+        response = (
+            '[{"need": "python web frameworks", "tool": "web_search", '
+            '"parameters": {"query": "C++ {templates} guide"}}, '
+            '{"need": "rust async runtimes", "tool": "fetch_webpage", '
+            '"parameters": {"url": "https://example.com", "options": {"render": true}}}]'
+        )
+        
+        selections = self.researcher._extract_batched_tool_selection(response, self.needs)
+        
+        self.assertEqual(selections, [
+            ("web_search", {"query": "C++ {templates} guide"}),
+            ("fetch_webpage", {"url": "https://example.com", "options": {"render": True}})
+        ])
+    
+    def test_unhashable_need_falls_back_to_position(self):
+        """Test that a list or dict echoed as the need does not raise."""
+        response = (
+            '[{"need": ["python web frameworks"], "tool": "web_search", "parameters": {}}, '
+            '{"need": {"text": "rust"}, "tool": "web_search", "parameters": {"query": "tokio"}}]'
+        )
+        
+        selections = self.researcher._extract_batched_tool_selection(response, self.needs)
+        
+        self.assertEqual(selections, [
+            ("web_search", {"query": ""}),
+            ("web_search", {"query": "tokio"})
+        ])
+    
+    def test_unparseable_response(self):
+        """Test that a response without a JSON array selects nothing."""
+        selections = self.researcher._extract_batched_tool_selection("Tool: web_search", self.needs)
+        
+        self.assertEqual(selections, [None, None])
+
+
+
+class TestSpeculativeSelection(unittest.TestCase):
+    """Tests for starting tool selection while the thinking step streams."""
+    
+    def test_keys_match_extracted_needs(self):
+        """Test that every need but the last is selected early, keyed as it is extracted."""
+        text = (
+            "Plan:\n\n1. tokio runtime\n\n2. async-std\n   - status\n\nThat is all.\n"
+            "3. smol executor\n\nDone."
+        )
+        llm_client = MagicMock()
+        llm_client.query_stream.return_value = iter([text[i:i + 3] for i in range(0, len(text), 3)])
+        researcher = ReActResearcher(llm_client)
+        
+        thinking_result, selections = researcher._think_with_speculative_selection("prompt")
+        
+        self.assertEqual(thinking_result, text)
+        self.assertEqual(list(selections), researcher._extract_research_needs(text)[:-1])
+        self.assertEqual(list(selections), ["tokio runtime", "async-std\n   - status\n\nThat is all."])
+        self.assertEqual(llm_client.query.call_count, 2)
+
+
+class TestHeuristicComplete(unittest.TestCase):
+    """Tests for the evaluation-skipping completeness heuristic."""
+    
+    def test_need_variants_share_findings(self):
+        """Test that needs differing only in case or punctuation count as covered."""
+        researcher = ReActResearcher(MagicMock(), Config({"react_min_evidence_chars": 10}))
+        context = {"findings": [
+            {"need": "What is Tokio?", "tool": "fetch_webpage", "result": {"content": "An async runtime for Rust"}}
+        ]}
+        
+        self.assertTrue(researcher._heuristic_complete(context, ["What is Tokio?", "what is tokio"]))
+        self.assertFalse(researcher._heuristic_complete(context, ["What is Tokio?", "what is async-std"]))
+
+
+@unittest.skipUnless(DISKCACHE_AVAILABLE, "diskcache is not installed")
+class TestToolResultCache(unittest.TestCase):
+    """Tests for the on-disk tool result cache."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config = Config({
+            "react_cache_dir": self.tmpdir.name,
+            "react_tool_cache_ttls": {"web_search": 60}
+        })
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+    
+    def _execute(self, call, result):
+        """Execute one tool call in a new researcher, returning its outcome and whether the tool ran."""
+        researcher = ReActResearcher(MagicMock(), self.config)
+        with patch.object(researcher, "_execute_tool", return_value=(result, None)) as execute_tool:
+            outcome = researcher._execute_tools([call])
+        researcher._get_disk_cache().close()
+        return outcome, execute_tool.called
+    
+    def test_result_reused_across_researchers(self):
+        """Test that a result is served from disk to the next researcher."""
+        call = ("web_search", {"query": "tokio"})
+        result = {"results": [{"title": "Tokio", "snippet": "runtime"}]}
+        
+        self.assertEqual(self._execute(call, result), ([(result, None)], True))
+        self.assertEqual(self._execute(call, {"results": []}), ([(result, None)], False))
+    
+    def test_empty_result_not_persisted(self):
+        """Test that an empty result is run again by the next researcher."""
+        call = ("web_search", {"query": "tokio"})
+        
+        self.assertEqual(self._execute(call, {"results": []}), ([({"results": []}, None)], True))
+        self.assertTrue(self._execute(call, {"results": []})[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
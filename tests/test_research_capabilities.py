@@ -0,0 +1,76 @@
+"""
+Tests for the research capabilities.
+
+This module contains unit tests for the OllamaResearch helpers and
+research result cache.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm_interface.llm.research_capabilities import OllamaResearch
+
+
+class TestExtractSearchTerms(unittest.TestCase):
+    """Tests for pulling suggested search terms out of LLM responses."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.research = OllamaResearch(MagicMock())
+    
+    def test_quoted_phrase_after_contraction(self):
+        """Test that an apostrophe in a contraction does not hide a quoted phrase."""
+        terms = self.research._extract_search_terms("I'd use 'rust tokio guide' next", "tokio")
+        
+        self.assertIn("rust tokio guide", terms)
+    
+    def test_keyword_phrase_after_contraction(self):
+        """Test that a keyword phrase following a contraction is found."""
+        terms = self.research._extract_search_terms("Let's try searching databases, or 'sql indexes'", "tokio")
+        
+        self.assertIn("searching databases", terms)
+        self.assertIn("sql indexes", terms)
+    
+    def test_list_items_preferred(self):
+        """Test that list items are used when the response has them."""
+        terms = self.research._extract_search_terms("Ideas:\n- tokio runtime\n2. async-std status", "tokio")
+        
+        self.assertEqual(terms, ["tokio runtime", "async-std status"])
+    
+    def test_only_leading_list_marker_stripped(self):
+        """Test that numbers later in a list item are kept."""
+        terms = self.research._extract_search_terms("1. Python 3.11 features\n- see step 2) first", "tokio")
+        
+        self.assertEqual(terms, ["Python 3.11 features", "see step 2) first"])
+
+
+
+class TestResearchCache(unittest.TestCase):
+    """Tests for reusing web research results between calls."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.research = OllamaResearch(MagicMock())
+        self.research._web_researcher = MagicMock()
+        self.research._web_researcher.format_research_for_prompt.return_value = ""
+        self.session = MagicMock(research_history=[])
+    
+    @patch.object(OllamaResearch, '_gather_research', return_value={"content": [], "sources": []})
+    def test_repeat_query_hits_cache(self, gather_research):
+        """Test that the same query, up to case and surrounding space, is researched once."""
+        self.research.perform_research("Rust async runtimes", self.session)
+        self.research.perform_research("  rust ASYNC runtimes ", self.session)
+        
+        self.assertEqual(gather_research.call_count, 1)
+    
+    @patch.object(OllamaResearch, '_gather_research', return_value={"content": [], "sources": []})
+    def test_different_query_misses_cache(self, gather_research):
+        """Test that a different query is researched again."""
+        self.research.perform_research("Rust async runtimes", self.session)
+        self.research.perform_research("Python async runtimes", self.session)
+        
+        self.assertEqual(gather_research.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for vector retrieval.
+
+This module contains unit tests for the SimpleVectorStore storage,
+persistence and similarity search.
+"""
+
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from llm_interface.config import Config
+from llm_interface.research.document import Document
+from llm_interface.research.retrieval import FAISS_AVAILABLE, SimpleVectorStore
+
+
+class TestSimpleVectorStore(unittest.TestCase):
+    """Tests for the SimpleVectorStore class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config = Config({"embeddings_dir": self.tmpdir.name})
+        self.store = SimpleVectorStore(self.config)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+    
+    def test_similarity_search_order(self):
+        """Test that the nearest documents come first."""
+        documents = [Document(text=name, doc_id=name) for name in ("a", "b", "c")]
+        self.store.add_embeddings(documents, [[0.0, 0.0], [1.0, 0.0], [5.0, 5.0]], "test")
+        
+        results = self.store.similarity_search([0.9, 0.0], k=2)
+        
+        self.assertEqual([doc.doc_id for doc, _ in results], ["b", "a"])
+        self.assertGreater(results[0][1], results[1][1])
+    
+    def test_add_existing_id_replaces(self):
+        """Test that adding a stored id replaces its document and embedding."""
+        self.store.add_embeddings([Document(text="old", doc_id="a")], [[0.0, 0.0]], "test")
+        self.store.add_embeddings([Document(text="far", doc_id="b")], [[3.0, 3.0]], "test")
+        self.store.add_embeddings([Document(text="new", doc_id="a")], [[5.0, 5.0]], "test")
+        
+        results = self.store.similarity_search([5.0, 5.0], k=2)
+        
+        self.assertEqual([doc.text for doc, _ in results], ["new", "far"])
+    
+    def test_published_snapshot_not_copied(self):
+        """Test that appending shares the published documents, and replacing leaves them intact."""
+        self.store.add_embeddings([Document(text="old", doc_id="a")], [[0.0, 0.0]], "test")
+        snapshot = self.store._snapshot
+        
+        self.store.add_embeddings([Document(text="far", doc_id="b")], [[3.0, 3.0]], "test")
+        self.assertIs(self.store._snapshot[5], snapshot[5])
+        
+        self.store.add_embeddings([Document(text="new", doc_id="a")], [[5.0, 5.0]], "test")
+        self.assertEqual(snapshot[5]["a"].text, "old")
+        self.assertEqual(snapshot[3].tolist(), [[0.0, 0.0]])
+    
+    def test_similarity_search_batch(self):
+        """Test that a batch search returns one result list per query."""
+        documents = [Document(text=name, doc_id=name) for name in ("a", "b", "c")]
+        self.store.add_embeddings(documents, [[0.0, 0.0], [1.0, 0.0], [5.0, 5.0]], "test")
+        
+        results = self.store.similarity_search_batch([[0.9, 0.0], [4.0, 4.0]], k=1)
+        
+        self.assertEqual([[doc.doc_id for doc, _ in row] for row in results], [["b"], ["c"]])
+    
+    @patch('llm_interface.research.retrieval.FAISS_AVAILABLE', False)
+    def test_dimension_mismatch_raises(self):
+        """Test that a query of the wrong dimensionality is rejected without FAISS."""
+        documents = [Document(text=name, doc_id=name) for name in ("a", "b")]
+        self.store.add_embeddings(documents, [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]], "test")
+        
+        for query in ([0.0] * 16, [0.0, 0.0]):
+            with self.assertRaises(ValueError):
+                self.store.similarity_search(query, k=1)
+    
+    def test_save_and_load_collection(self):
+        """Test that a saved collection loads into a new store."""
+        documents = [
+            Document(text="first", metadata={"url": "http://a"}, doc_id="a"),
+            Document(text="second", doc_id="b")
+        ]
+        self.store.add_embeddings(documents, [[1.0, 0.0], [0.0, 1.0]], "test")
+        
+        loaded = SimpleVectorStore(self.config)
+        
+        self.assertTrue(loaded.load_collection("test"))
+        results = loaded.similarity_search([0.0, 1.0], k=1)
+        self.assertEqual(results[0][0].text, "second")
+        self.assertEqual(loaded.documents["a"].metadata, {"url": "http://a"})
+    
+    @unittest.skipUnless(FAISS_AVAILABLE, "faiss is not installed")
+    def test_saved_index_topped_up_on_load(self):
+        """Test that appending does not rewrite the saved index, and loading adds the missing rows."""
+        documents = [Document(text=name, doc_id=name) for name in ("a", "b")]
+        self.store.add_embeddings(documents, [[0.0, 0.0], [1.0, 0.0]], "test")
+        
+        with patch('llm_interface.research.retrieval.faiss.write_index') as write_index:
+            self.store.add_embeddings([Document(text="c", doc_id="c")], [[5.0, 5.0]], "test")
+        write_index.assert_not_called()
+        
+        loaded = SimpleVectorStore(self.config)
+        
+        self.assertTrue(loaded.load_collection("test"))
+        self.assertEqual(loaded.faiss_index.ntotal, 3)
+        self.assertEqual(loaded.similarity_search([4.0, 4.0], k=1)[0][0].doc_id, "c")
+
+
+if __name__ == "__main__":
+    unittest.main()
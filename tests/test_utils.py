@@ -0,0 +1,65 @@
+"""
+Tests for the utility helpers.
+
+This module contains unit tests for the shared helper functions and classes.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from llm_interface.utils.helpers import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Tests for the TTLCache class."""
+    
+    def test_get_and_set(self):
+        """Test storing and retrieving values."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("missing"))
+        self.assertIn("a", cache)
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+    
+    @patch('llm_interface.utils.helpers.time.monotonic')
+    def test_expiry(self, mock_monotonic):
+        """Test that entries expire after the TTL."""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        
+        mock_monotonic.return_value = 105.0
+        self.assertEqual(cache.get("a"), 1)
+        
+        mock_monotonic.return_value = 111.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+    
+    @patch('llm_interface.utils.helpers.time.monotonic')
+    def test_per_entry_ttl(self, mock_monotonic):
+        """Test that an entry's own TTL overrides the cache default."""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("short", 1, ttl=2)
+        cache.set("default", 2)
+        
+        mock_monotonic.return_value = 105.0
+        self.assertNotIn("short", cache)
+        self.assertIn("default", cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Tests for web research.
+
+This module contains unit tests for URL canonicalization, the WebSearch
+result cache and the WebResearcher page fetching.
+"""
+
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from llm_interface.config import Config
+from llm_interface.research.web import DISKCACHE_AVAILABLE, WebResearcher, WebSearch, _canonicalize_url
+
+
+class TestCanonicalizeUrl(unittest.TestCase):
+    """Tests for the _canonicalize_url function."""
+    
+    def test_scheme_and_host_lowercased(self):
+        """Test that the scheme and host are lowercased but the path is not."""
+        self.assertEqual(_canonicalize_url("HTTPS://Example.COM/Path"), "https://example.com/Path")
+    
+    def test_default_port_removed(self):
+        """Test that only the scheme's own default port is removed."""
+        self.assertEqual(_canonicalize_url("http://example.com:80/a"), "http://example.com/a")
+        self.assertEqual(_canonicalize_url("https://example.com:443/a"), "https://example.com/a")
+        self.assertEqual(_canonicalize_url("http://example.com:443/a"), "http://example.com:443/a")
+        self.assertEqual(_canonicalize_url("https://example.com:8443/a"), "https://example.com:8443/a")
+    
+    def test_fragment_removed(self):
+        """Test that the fragment is dropped."""
+        self.assertEqual(_canonicalize_url("https://example.com/a#section-2"), "https://example.com/a")
+    
+    def test_query_sorted_without_tracking_params(self):
+        """Test that query parameters are sorted and tracking parameters dropped."""
+        self.assertEqual(
+            _canonicalize_url("https://example.com/a?b=2&utm_source=x&a=1&fbclid=y&gclid=z"),
+            "https://example.com/a?a=1&b=2"
+        )
+        self.assertEqual(_canonicalize_url("https://example.com/a?b=2&a=1"),
+                         _canonicalize_url("https://example.com/a?a=1&b=2"))
+    
+    def test_trailing_slash_removed(self):
+        """Test that a trailing slash does not make a different page."""
+        self.assertEqual(_canonicalize_url("https://example.com/a/"), "https://example.com/a")
+        self.assertEqual(_canonicalize_url("https://example.com/"), "https://example.com")
+    
+    def test_invalid_url_unchanged(self):
+        """Test that a URL that cannot be parsed is returned as it is."""
+        self.assertEqual(_canonicalize_url("http://example.com:port/a"), "http://example.com:port/a")
+
+
+class TestWebSearchCache(unittest.TestCase):
+    """Tests for caching search results in memory and on disk."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config = Config({
+            "web_cache_dir": self.tmpdir.name,
+            "web_cache_ttl": 100,
+            "web_failure_cache_ttl": 10
+        })
+        self.searches = []
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+    
+    def _search(self, web_search, results):
+        """Search through the cache, recording whether the search really ran."""
+        def search(query, max_results, debug=False):
+            self.searches.append(query)
+            return results
+        
+        with patch.object(web_search, '_search', side_effect=search):
+            return web_search.search("tokio", max_results=5)
+    
+    @patch('llm_interface.research.web.DISKCACHE_AVAILABLE', False)
+    @patch('llm_interface.utils.helpers.time.monotonic')
+    def test_memory_cache_ttl(self, monotonic):
+        """Test that results are reused until the cache TTL has passed."""
+        web_search = WebSearch(self.config)
+        results = [{"title": "Tokio", "snippet": "runtime", "url": "https://tokio.rs"}]
+        
+        monotonic.return_value = 1000.0
+        self.assertEqual(self._search(web_search, results), results)
+        monotonic.return_value = 1099.0
+        self.assertEqual(self._search(web_search, results), results)
+        self.assertEqual(len(self.searches), 1)
+        
+        monotonic.return_value = 1101.0
+        self._search(web_search, results)
+        self.assertEqual(len(self.searches), 2)
+    
+    @patch('llm_interface.research.web.DISKCACHE_AVAILABLE', False)
+    @patch('llm_interface.utils.helpers.time.monotonic')
+    def test_memory_cache_failure_ttl(self, monotonic):
+        """Test that an empty result is only reused for the shorter failure TTL."""
+        web_search = WebSearch(self.config)
+        
+        monotonic.return_value = 1000.0
+        self._search(web_search, [])
+        monotonic.return_value = 1009.0
+        self._search(web_search, [])
+        self.assertEqual(len(self.searches), 1)
+        
+        monotonic.return_value = 1011.0
+        self._search(web_search, [])
+        self.assertEqual(len(self.searches), 2)
+    
+    @unittest.skipUnless(DISKCACHE_AVAILABLE, "diskcache is not installed")
+    def test_disk_cache_ttls(self):
+        """Test that results reach a new client from disk, stored with the matching TTL."""
+        results = [{"title": "Tokio", "snippet": "runtime", "url": "https://tokio.rs"}]
+        with WebSearch(self.config) as web_search:
+            self._search(web_search, results)
+            web_search._set_cached(("page", "https://tokio.rs/missing"), "")
+            
+            disk_cache = web_search._get_disk_cache()
+            _, expire_time = disk_cache.get(("search", "tokio", 5), expire_time=True)
+            self.assertAlmostEqual(expire_time - time.time(), 100, delta=5)
+            _, expire_time = disk_cache.get(("page", "https://tokio.rs/missing"), expire_time=True)
+            self.assertAlmostEqual(expire_time - time.time(), 10, delta=5)
+        
+        with WebSearch(self.config) as web_search:
+            self.assertEqual(self._search(web_search, []), results)
+        self.assertEqual(len(self.searches), 1)
+
+
+class TestWebResearcher(unittest.TestCase):
+    """Tests for the WebResearcher class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.researcher = WebResearcher(Config({"web_min_host_interval": 0}))
+    
+    @patch.object(WebSearch, 'fetch_content', side_effect=lambda url, debug=False: f"text of {url}")
+    def test_fetches_only_needed_candidates(self, fetch_content):
+        """Test that duplicate and skipped candidates are not fetched, nor candidates beyond what is wanted."""
+        candidates = [
+            {"url": "https://a.com/one"},
+            {"url": "https://a.com/one/"},
+            {"url": "https://b.com/two"},
+            {"url": "https://c.com/three"},
+            {"url": "https://d.com/four"}
+        ]
+        used = []
+        
+        for result, text in self.researcher._iter_fetched(candidates, lambda: 2 - len(used),
+                                                          lambda result: "b.com" in result["url"]):
+            used.append((result["url"], text))
+        
+        self.assertEqual(used, [
+            ("https://a.com/one", "text of https://a.com/one"),
+            ("https://c.com/three", "text of https://c.com/three")
+        ])
+        self.assertEqual(sorted(call.args[0] for call in fetch_content.call_args_list),
+                         ["https://a.com/one", "https://c.com/three"])
+    
+    @patch.object(WebSearch, 'fetch_content', side_effect=lambda url, debug=False: "" if "a.com" in url else url)
+    def test_failed_fetch_fetches_next_candidate(self, fetch_content):
+        """Test that a page that could not be fetched is replaced by the next candidate."""
+        candidates = [{"url": "https://a.com/one"}, {"url": "https://b.com/two"}, {"url": "https://c.com/three"}]
+        used = []
+        
+        for result, text in self.researcher._iter_fetched(candidates, lambda: 1 - len(used)):
+            if text:
+                used.append(result["url"])
+        
+        self.assertEqual(used, ["https://b.com/two"])
+        self.assertEqual(fetch_content.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()